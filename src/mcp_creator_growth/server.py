@@ -441,12 +441,15 @@ async def debug_record(
             context["error_message"] = "No message provided"
 
         # Record the experience
-        record_id = index_manager.record(
-            context=context,
-            cause=cause,
-            solution=solution,
-            tags=tags,
-        )
+        try:
+            record_id = index_manager.record(
+                context=context,
+                cause=cause,
+                solution=solution,
+                tags=tags,
+            )
+        finally:
+            index_manager.close()
 
         debug_log(f"Debug experience recorded: {record_id}")
         # Minimal return to reduce context pollution
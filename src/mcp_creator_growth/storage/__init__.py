@@ -11,6 +11,7 @@ from .path_resolver import (
     get_global_storage_path,
     get_project_hash,
     get_global_config_dir,
+    resolve_project_directory,
     resolve_storage_priority,
 )
 from .serializers import (
@@ -54,6 +55,7 @@ __all__ = [
     "get_global_storage_path",
     "get_project_hash",
     "get_global_config_dir",
+    "resolve_project_directory",
     "resolve_storage_priority",
     # Serializers
     "serialize_to_json",
@@ -7,12 +7,208 @@ Provides CRUD operations for debug records.
 """
 
 import json
+import atexit
 import hashlib
+import io
+import os
+import string
+import sys
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 
 from ..debug import server_debug_log as debug_log
+from .path_resolver import resolve_project_directory
+from .project_meta import ProjectMetaManager
+from .serializers import (
+    dump_json_bytes,
+    fsync_dir,
+    load_json_bytes,
+    read_json_bytes_file,
+    replace_file_bytes,
+)
+
+
+# Only filter truly generic stop words, keep debug-related terms
+_STOP_WORDS = frozenset({
+    "a", "an", "the", "is", "are", "was", "were", "be", "been",
+    "to", "of", "in", "for", "on", "with", "at", "by", "from",
+    "and", "or", "not", "no", "as", "it", "this", "that", "none",
+    "true", "false", "can", "could", "would", "should", "have",
+    "has", "had", "do", "does", "did", "will", "may",
+})
+
+_WORD_CHARS = frozenset(map(ord, string.ascii_letters + string.digits + "_"))
+
+
+class _DelimiterTable(dict):
+    """str.translate table mapping every non-word character to a space.
+
+    ASCII is filled in up front; other characters are resolved on first
+    sight and cached, so they still act as delimiters like the old
+    ``[^a-zA-Z0-9_]+`` split did.
+    """
+
+    def __missing__(self, code: int) -> int | str:
+        value = code if code in _WORD_CHARS else " "
+        self[code] = value
+        return value
+
+
+# Shared with the retrieval tokenizer: text.translate(WORD_DELIMITERS).split()
+WORD_DELIMITERS = _DelimiterTable({c: " " for c in range(128) if c not in _WORD_CHARS})
+
+
+def synonym_closure(synonyms: dict[str, list[str]]) -> dict[str, frozenset[str]]:
+    """
+    Flatten a synonym table into symmetric, transitive synonym groups.
+
+    Every word, whether a key or a listed synonym, maps to all other words
+    it is connected to, so "nil" expands to "null" as well as the reverse.
+
+    Args:
+        synonyms: Mapping of words to their synonyms
+
+    Returns:
+        Mapping of each word to its synonyms (excluding itself)
+    """
+    groups: dict[str, set[str]] = {}
+    for word, words in synonyms.items():
+        group = {word, *words}
+        for member in list(group):
+            if member in groups:
+                group |= groups[member]
+        for member in group:
+            groups[member] = group
+    return {word: frozenset(group - {word}) for word, group in groups.items()}
+
+
+# Single worker so meta.json updates are applied one at a time, in order
+_meta_pool: ThreadPoolExecutor | None = None
+_meta_pool_lock = threading.Lock()
+
+
+def _get_meta_pool() -> ThreadPoolExecutor:
+    """Return the background pool for project metadata updates, creating it on first use."""
+    global _meta_pool
+    with _meta_pool_lock:
+        if _meta_pool is None:
+            _meta_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-meta")
+            atexit.register(_meta_pool.shutdown)
+    return _meta_pool
+
+
+# Shared pool for reading record files concurrently (see DebugIndexManager.get_records)
+_read_pool: ThreadPoolExecutor | None = None
+_read_pool_lock = threading.Lock()
+
+
+def _get_read_pool(max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared record-reading pool, creating it on first use."""
+    global _read_pool
+    with _read_pool_lock:
+        if _read_pool is None:
+            _read_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="debug-read")
+            atexit.register(_read_pool.shutdown)
+    return _read_pool
+
+
+@dataclass(slots=True)
+class IndexEntry:
+    """
+    Compact in-memory index entry for one debug record.
+
+    Slotted to keep per-record overhead low; converted to a plain dict
+    (with the short on-disk keys) only when the index is written.
+    """
+    id: str
+    ts: float | str  # Epoch seconds (older indexes store ISO-8601 strings)
+    et: str          # error_type
+    tags: list[str]
+    kw: list[str] | None = None  # Cached keywords (None for entries predating the cache)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "IndexEntry":
+        """Build an entry from its on-disk form (supports legacy long keys)."""
+        return cls(
+            id=data["id"],
+            ts=data.get("ts") or data.get("timestamp", ""),
+            et=data.get("et") or data.get("error_type", "Unknown"),
+            tags=data.get("tags", []),
+            kw=data.get("kw"),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the compact on-disk form."""
+        data = {"id": self.id, "ts": self.ts, "et": self.et, "tags": self.tags}
+        if self.kw is not None:
+            data["kw"] = self.kw
+        return data
+
+
+@dataclass(slots=True)
+class IndexColumns:
+    """
+    Column-oriented (structure of arrays) storage for all index entries.
+
+    Row i is spread across the parallel lists; postings in the inverted
+    indexes are row offsets, so the "id" column doubles as the offset to
+    record ID table. Rows are materialized as IndexEntry only on demand.
+    """
+    id: list[str] = field(default_factory=list)
+    ts: list[float | str] = field(default_factory=list)
+    et: list[str] = field(default_factory=list)
+    tags: list[list[str]] = field(default_factory=list)
+    kw: list[list[str] | None] = field(default_factory=list)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[IndexEntry]) -> "IndexColumns":
+        """Build columns from row entries."""
+        columns = cls()
+        for entry in entries:
+            columns.append(entry)
+        return columns
+
+    @classmethod
+    def from_dict(cls, data: dict[str, list[Any]]) -> "IndexColumns":
+        """Build columns from their on-disk form."""
+        ids = data.get("id", [])
+        return cls(
+            id=ids,
+            ts=data.get("ts", []),
+            et=[sys.intern(et) for et in data.get("et", [])],
+            tags=data.get("tags", []),
+            kw=data.get("kw") or [None] * len(ids),
+        )
+
+    def to_dict(self) -> dict[str, list[Any]]:
+        """Convert to the on-disk form (one JSON array per column)."""
+        return {"id": self.id, "ts": self.ts, "et": self.et, "tags": self.tags, "kw": self.kw}
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def append(self, entry: IndexEntry) -> None:
+        """Add one entry as a new row."""
+        self.id.append(entry.id)
+        self.ts.append(entry.ts)
+        self.et.append(sys.intern(entry.et))  # Few distinct values, one str each
+        self.tags.append(entry.tags)
+        self.kw.append(entry.kw)
+
+    def row(self, i: int) -> IndexEntry:
+        """Materialize row i as an IndexEntry."""
+        return IndexEntry(self.id[i], self.ts[i], self.et[i], self.tags[i], self.kw[i])
+
+    def rows(self, start: int = 0) -> Iterator[IndexEntry]:
+        """Iterate rows from the given offset (negative counts from the end)."""
+        for i in range(*slice(start, None).indices(len(self.id))):
+            yield self.row(i)
 
 
 class DebugIndexManager:
@@ -22,10 +218,39 @@ class DebugIndexManager:
     Storage structure:
     {project_root}/.mcp-sidecar/debug/
     ├── index.json            # Index of all records
+    ├── index.log             # Journal of entries appended since last index.json write
     ├── 20260118_001.json     # Individual record files
     └── 20260118_002.json
     """
 
+    # Index schema version (6: entries stored as "columns"; postings are row offsets)
+    INDEX_VERSION = 6
+
+    # Rewrite index.json (and truncate the journal) once the journal exceeds this size
+    JOURNAL_COMPACT_BYTES = 256 * 1024
+
+    # Memory-map index.json instead of read() when it is at least this large
+    MMAP_THRESHOLD_BYTES = 64 * 1024
+
+    # Keep at most this many (most recent) records per keyword as records are added;
+    # rebuild_keywords() restores complete posting lists from the cached keywords
+    MAX_POSTING = 500
+
+    # Once the index holds DF_PRUNE_MIN_RECORDS records, rebuilds drop the posting
+    # lists of keywords found in more than MAX_KEYWORD_DF of them (stop-word-like
+    # terms add little to ranking but dominate index size). Their record counts
+    # in keyword_df are kept, and they stay unposted until the next rebuild.
+    MAX_KEYWORD_DF = 0.25
+    DF_PRUNE_MIN_RECORDS = 50
+
+    # Number of parsed record files kept in memory (least recently used are dropped)
+    RECORD_CACHE_SIZE = 256
+
+    # Threads used to read record files for tag/error-type searches, and the
+    # number of uncached files below which they are read serially instead
+    READ_WORKERS = 8
+    PARALLEL_READ_MIN = 4
+
     def __init__(self, project_directory: str):
         """
         Initialize the debug index manager.
@@ -33,54 +258,316 @@ class DebugIndexManager:
         Args:
             project_directory: The project root directory
         """
-        self.project_directory = Path(project_directory).resolve()
+        self.project_directory = resolve_project_directory(project_directory)
         self.storage_dir = self.project_directory / ".mcp-sidecar" / "debug"
         self.index_file = self.storage_dir / "index.json"
+        self.journal_file = self.storage_dir / "index.log"
+        # Open journal file; each delta is handed to the OS in one unbuffered write
+        self._journal_fh: io.FileIO | None = None
+        # Whether the journal ends in a torn line (next append starts a new line)
+        self._journal_torn = False
+
+        # The project tag in record IDs never changes, so hash the path once
+        self._project_hash = hashlib.md5(
+            str(self.project_directory).encode("utf-8", "surrogateescape"), usedforsecurity=False
+        ).hexdigest()[:4]
+        # Parsed record files by ID, in least- to most-recently used order
+        self._record_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._record_cache_lock = threading.Lock()
+        # Nesting depth of batch() blocks; index writes are deferred while > 0
+        self._batch_depth = 0
+        # Project metadata manager, created on the first record()
+        self._meta: ProjectMetaManager | None = None
 
         # Ensure storage directory exists
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load or create index
-        self._index = self._load_index()
+        # The index is loaded on first use (see the _index property), so
+        # callers that only read record files never parse index.json
+        self._index_data: dict[str, Any] | None = None
+        self._id_to_idx: dict[str, int] = {}
+
+    @property
+    def _index(self) -> dict[str, Any]:
+        """The in-memory index, loaded (and journal replayed) on first access."""
+        if self._index_data is None:
+            self._index_data = self._load_index()
+            self._id_to_idx = self._map_ids(self._index_data["columns"].id)
+            self._replay_journal()
+        return self._index_data
+
+    @_index.setter
+    def _index(self, value: dict[str, Any]) -> None:
+        self._index_data = value
+
+    @property
+    def records(self) -> list[IndexEntry]:
+        """All index entries as rows (materialized from the columns)."""
+        return list(self._index["columns"].rows())
 
     def _load_index(self) -> dict[str, Any]:
         """Load the index from file or create a new one.
 
         Index structure (Progressive Disclosure):
-        - records: Minimal metadata only (id, ts, et, tags)
-        - tags: Inverted index for tag-based lookup
+        - columns: Minimal metadata only, one parallel list per field
+          (id, ts as epoch seconds, et, tags, kw)
+        - tags: Inverted index for tag-based lookup (postings are row offsets into columns)
         - error_types: Inverted index for error type lookup
-        - keywords: Lazy-built, can be rebuilt from records via rebuild_keywords()
+        - keywords: Lazy-built, can be rebuilt from the cached "kw" lists via rebuild_keywords()
+        - keyword_df: Number of records containing each keyword (posting lists are
+          capped, so their length understates it); used for IDF weighting
+        - id_counters: Highest record ID counter issued per date, so new IDs need no scan
 
         Note: Detailed content (cause, solution) stays in record files.
         """
         if self.index_file.exists():
             try:
-                with open(self.index_file, "r", encoding="utf-8") as f:
-                    index = json.load(f)
-                    # Migrate old index if needed
-                    if "keywords" not in index:
-                        index["keywords"] = {}
-                    if "error_types" not in index:
-                        index["error_types"] = {}
-                    return index
-            except (json.JSONDecodeError, IOError) as e:
+                index = read_json_bytes_file(self.index_file, self.MMAP_THRESHOLD_BYTES)
+                # Migrate old index if needed
+                if "keywords" not in index:
+                    index["keywords"] = {}
+                if "error_types" not in index:
+                    index["error_types"] = {}
+                if "columns" in index:
+                    index["columns"] = IndexColumns.from_dict(index["columns"])
+                else:
+                    # v3 index: one dict per record, postings hold record IDs
+                    self._migrate_postings(index)
+                    records = index.pop("records", [])
+                    index["columns"] = IndexColumns.from_entries(IndexEntry.from_dict(r) for r in records)
+                    index["version"] = self.INDEX_VERSION
+                if "id_counters" not in index:
+                    index["id_counters"] = self._scan_id_counters(index["columns"].id)
+                if "keyword_df" not in index:
+                    index["keyword_df"] = self._count_keyword_df(index["columns"], index["keywords"])
+                return index
+            except (json.JSONDecodeError, ValueError, IOError) as e:
                 debug_log(f"Error loading index: {e}, creating new index")
 
+        return self._empty_index()
+
+    def _empty_index(self) -> dict[str, Any]:
+        """Create an empty index with the current schema."""
         return {
-            "version": 3,  # Bumped for progressive disclosure
+            "version": self.INDEX_VERSION,
             "created_at": datetime.now().isoformat(),
-            "records": [],
+            "columns": IndexColumns(),
             "tags": {},
             "keywords": {},      # Lazy: rebuilt on demand
+            "keyword_df": {},    # Records per keyword (uncapped, for IDF)
             "error_types": {},
+            "id_counters": {},   # Highest record ID counter issued per date
         }
 
-    def _save_index(self) -> None:
-        """Save the index to file (compact mode for token savings)."""
+    def _migrate_postings(self, index: dict[str, Any]) -> None:
+        """Migrate v3 postings (record-ID strings) to integer offsets into the record list.
+
+        Postings for IDs with no index record are dropped.
+        """
+        id_to_idx: dict[str, int] = {}
+        for i, record in enumerate(index.get("records", [])):
+            id_to_idx.setdefault(record["id"], i)
+        for name in ("tags", "keywords", "error_types"):
+            for key, record_ids in index[name].items():
+                index[name][key] = [id_to_idx[rid] for rid in record_ids if rid in id_to_idx]
+            # Drop lists left empty (an empty keyword list would read as pruned)
+            index[name] = {key: postings for key, postings in index[name].items() if postings}
+        debug_log(f"Migrated debug index postings to record offsets ({len(id_to_idx)} records)")
+
+    @staticmethod
+    def _count_keyword_df(columns: IndexColumns, keywords: dict[str, list[int]]) -> dict[str, int]:
+        """Count the records containing each indexed keyword (index migration).
+
+        Entries without cached keywords are not counted, so a keyword's
+        count is never taken below the length of its posting list.
+        """
+        counts: Counter[str] = Counter()
+        for kws in columns.kw:
+            if kws:
+                counts.update(kws)
+        return {kw: max(counts[kw], len(postings)) for kw, postings in keywords.items()}
+
+    def _prune_common_keywords(self, index: dict[str, Any]) -> int:
+        """Empty the posting lists of keywords found in too many records (see MAX_KEYWORD_DF).
+
+        An empty list marks the keyword as pruned, so record() does not
+        start posting it again.
+
+        Returns:
+            Number of keywords pruned
+        """
+        total = len(index["columns"])
+        if total < self.DF_PRUNE_MIN_RECORDS:
+            return 0
+        max_df = total * self.MAX_KEYWORD_DF
+        pruned = 0
+        for kw, bucket in index["keywords"].items():
+            if bucket and index["keyword_df"].get(kw, len(bucket)) > max_df:
+                index["keywords"][kw] = []
+                pruned += 1
+        return pruned
+
+    @staticmethod
+    def _map_ids(ids: list[str]) -> dict[str, int]:
+        """Map each record ID to its (first) row offset."""
+        id_to_idx: dict[str, int] = {}
+        for i, record_id in enumerate(ids):
+            id_to_idx.setdefault(record_id, i)
+        return id_to_idx
+
+    @staticmethod
+    def _parse_ts(timestamp: str) -> float | str:
+        """Convert a record's ISO-8601 timestamp to epoch seconds for the index."""
+        try:
+            return datetime.fromisoformat(timestamp).timestamp()
+        except (TypeError, ValueError):
+            return timestamp
+
+    @staticmethod
+    def _format_ts(ts: float | str | None) -> str | None:
+        """Format an index timestamp as ISO-8601 (older indexes already store strings)."""
+        if isinstance(ts, (int, float)):
+            return datetime.fromtimestamp(ts).isoformat()
+        return ts
+
+    def _resolve_ids(self, postings: list[int]) -> list[str]:
+        """Translate posting offsets back to record IDs."""
+        ids = self._index["columns"].id
+        return [ids[i] for i in postings]
+
+    def _save_index(self, fsync: bool = False) -> None:
+        """Save the index to file (compact mode for token savings).
+
+        The full index now contains every journaled entry, so the journal
+        is truncated afterwards.
+
+        Args:
+            fsync: If True, make the new index.json durable before truncating the journal
+        """
+        self._close_journal()
         self._index["updated_at"] = datetime.now().isoformat()
-        with open(self.index_file, "w", encoding="utf-8") as f:
-            json.dump(self._index, f, ensure_ascii=False)
+        data = {**self._index, "columns": self._index["columns"].to_dict()}
+        replace_file_bytes(self.index_file, dump_json_bytes(data), fsync=fsync)
+        if fsync:
+            fsync_dir(self.storage_dir)
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_torn = False
+
+    def _append_journal(self, index_entry: IndexEntry, tags: list[str]) -> None:
+        """Append one new-record delta to the journal instead of rewriting index.json.
+
+        The line is written unbuffered, so once record() returns any other
+        manager replaying the journal sees the entry.
+        """
+        if self._journal_fh is None:
+            self._journal_fh = io.FileIO(self.journal_file, "ab")
+        delta = {"entry": index_entry.to_dict(), "tags": tags}
+        line = dump_json_bytes(delta) + b"\n"
+        if self._journal_torn:
+            line = b"\n" + line
+            self._journal_torn = False
+        self._journal_fh.write(line)
+
+    def _close_journal(self) -> None:
+        """Close the journal file if one is open."""
+        if self._journal_fh is not None:
+            self._journal_fh.close()
+            self._journal_fh = None
+
+    def flush(self, fsync: bool = False) -> None:
+        """
+        Make journal entries durable.
+
+        Entries are already written to the OS as they are appended; this
+        only matters for surviving a crash of the machine.
+
+        Args:
+            fsync: If True, fsync the journal so the entries survive a crash
+        """
+        if self._journal_fh is not None and fsync:
+            os.fsync(self._journal_fh.fileno())
+
+    def close(self) -> None:
+        """Release the journal file."""
+        self._close_journal()
+
+    def _replay_journal(self) -> None:
+        """Apply journaled entries that are not yet part of index.json."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+
+        self._journal_torn = bool(lines) and not lines[-1].endswith(b"\n")
+        replayed = 0
+        for line in lines:
+            try:
+                delta = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted append; the record file still exists
+                debug_log("Skipping unreadable debug index journal line")
+                continue
+            entry = IndexEntry.from_dict(delta["entry"])
+            if entry.id in self._id_to_idx:
+                continue  # Already saved into index.json
+            self._add_to_index(entry, delta["tags"])
+            replayed += 1
+
+        if replayed:
+            debug_log(f"Replayed {replayed} debug index journal entries")
+
+    def _maybe_compact(self) -> None:
+        """Fold the journal into index.json once it exceeds JOURNAL_COMPACT_BYTES."""
+        if self._journal_size() > self.JOURNAL_COMPACT_BYTES:
+            self._save_index()
+
+    def _journal_size(self) -> int:
+        """Get the current journal size in bytes (0 if there is no journal)."""
+        if self._journal_fh is not None:
+            return self._journal_fh.tell()
+        try:
+            return self.journal_file.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _add_to_index(self, index_entry: IndexEntry, tags: list[str]) -> None:
+        """Append a compact entry and add it to the inverted indexes."""
+        columns = self._index["columns"]
+        idx = len(columns)
+        columns.append(index_entry)
+        self._id_to_idx.setdefault(index_entry.id, idx)
+        self._note_id_counter(index_entry.id)
+
+        # Update tag inverted index
+        for tag in tags:
+            tag_lower = tag.lower()
+            if tag_lower not in self._index["tags"]:
+                self._index["tags"][sys.intern(tag_lower)] = []
+            self._index["tags"][tag_lower].append(idx)
+
+        # Update error type inverted index
+        et_lower = index_entry.et.lower()
+        if et_lower not in self._index["error_types"]:
+            self._index["error_types"][sys.intern(et_lower)] = []
+        self._index["error_types"][et_lower].append(idx)
+
+        # Update keyword inverted index (include error_type, error_message, tags)
+        keyword_df = self._index["keyword_df"]
+        for kw in index_entry.kw or ():
+            keyword_df[kw] = keyword_df.get(kw, 0) + 1
+            bucket = self._index["keywords"].get(kw)
+            if bucket is None:
+                bucket = self._index["keywords"][sys.intern(kw)] = []
+            elif not bucket:
+                continue  # Pruned as too common by the last rebuild
+            # Postings are appended in row order, so a repeat of this row
+            # can only be the last element; no need to scan the list
+            if not bucket or bucket[-1] != idx:
+                bucket.append(idx)
+                if len(bucket) > self.MAX_POSTING:
+                    # Bound common keywords to their most recent records
+                    del bucket[:-self.MAX_POSTING]
 
     # Synonym mappings for debug-related terms
     SYNONYMS = {
@@ -94,6 +581,8 @@ class DebugIndexManager:
         "null": ["none", "nil", "undefined", "empty"],
         "crash": ["failure", "abort", "terminate", "halt"],
     }
+    # Symmetric, transitive form of SYNONYMS used for expansion
+    _SYNONYM_CLOSURE = synonym_closure(SYNONYMS)
 
     def _extract_keywords(self, text: str) -> list[str]:
         """Extract searchable keywords from text.
@@ -104,45 +593,88 @@ class DebugIndexManager:
         Note: Debug-related terms (error, exception, bug) are intentionally
         NOT filtered as stop words since they're critical for debug search.
         """
-        import re
         # Split on non-alphanumeric, filter short/common words
-        words = re.split(r'[^a-zA-Z0-9_]+', text.lower())
-        # Only filter truly generic stop words, keep debug-related terms
-        stop_words = {
-            "a", "an", "the", "is", "are", "was", "were", "be", "been",
-            "to", "of", "in", "for", "on", "with", "at", "by", "from",
-            "and", "or", "not", "no", "as", "it", "this", "that", "none",
-            "true", "false", "can", "could", "would", "should", "have",
-            "has", "had", "do", "does", "did", "will", "would", "may",
-        }
-        return list(set(w for w in words if len(w) >= 3 and w not in stop_words))[:30]
+        seen: set[str] = set()
+        keywords: list[str] = []
+        for w in text.lower().translate(WORD_DELIMITERS).split():
+            if len(w) >= 3 and w not in _STOP_WORDS and w not in seen:
+                seen.add(w)
+                keywords.append(sys.intern(w))  # Shared by every record and bucket using it
+                if len(keywords) == 30:
+                    break
+        return keywords
+
+    def _record_keywords(self, record: dict[str, Any]) -> list[str]:
+        """Extract index keywords from a full record (error_type, error_message, cause, solution, tags)."""
+        context = record.get("context", {})
+        error_type = context.get("error_type", "Unknown")
+        error_message = context.get("error_message", "")
+        cause = record.get("cause", "")
+        solution = record.get("solution", "")
+        tags_text = " ".join(record.get("tags", []))
+        return self._extract_keywords(f"{error_type} {error_message} {cause} {solution} {tags_text}")
 
     def _expand_synonyms(self, keywords: list[str]) -> list[str]:
         """Expand keywords with synonyms for better recall."""
         expanded = set(keywords)
         for kw in keywords:
-            if kw in self.SYNONYMS:
-                expanded.update(self.SYNONYMS[kw])
+            expanded.update(self._SYNONYM_CLOSURE.get(kw, ()))
         return list(expanded)
 
     def _generate_id(self) -> str:
-        """Generate a unique ID for a new record."""
+        """Generate a unique ID for a new record.
+
+        The ID is reserved by creating its (empty) record file exclusively,
+        so another manager on the same project, whose index may not have
+        seen our latest journal entries, can never issue it again.
+        """
         now = datetime.now()
         date_str = now.strftime("%Y%m%d")
 
-        # Create a unique suffix using project hash + timestamp
-        project_hash = hashlib.md5(
-            str(self.project_directory).encode()
-        ).hexdigest()[:4]
-
-        existing = [r["id"] for r in self._index["records"] if r["id"].startswith(date_str)]
-
-        # Find the next available number
-        counter = 1
-        while f"{date_str}_{project_hash}_{counter:03d}" in existing:
+        # Create a unique suffix using project hash + per-day counter
+        prefix = f"{date_str}_{self._project_hash}_"
+        counter = self._index["id_counters"].get(date_str, 0) + 1
+        while True:
+            record_id = f"{prefix}{counter:03d}"
+            if record_id not in self._id_to_idx:
+                try:
+                    fd = os.open(self.storage_dir / f"{record_id}.json", os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                except FileExistsError:
+                    pass  # Issued by another manager (or created outside this index)
+                else:
+                    os.close(fd)
+                    break
             counter += 1
+        self._index["id_counters"][date_str] = counter
+
+        return record_id
 
-        return f"{date_str}_{project_hash}_{counter:03d}"
+    @staticmethod
+    def _id_counter(record_id: str) -> tuple[str, int] | None:
+        """Split a "<date>_<hash>_<counter>" record ID into (date, counter)."""
+        parts = record_id.split("_")
+        if len(parts) != 3 or not parts[2].isdigit():
+            return None
+        return parts[0], int(parts[2])
+
+    def _note_id_counter(self, record_id: str) -> None:
+        """Raise the stored counter for the record's date to cover its ID."""
+        parsed = self._id_counter(record_id)
+        if parsed:
+            counters = self._index["id_counters"]
+            date_str, counter = parsed
+            if counter > counters.get(date_str, 0):
+                counters[date_str] = counter
+
+    @classmethod
+    def _scan_id_counters(cls, ids: list[str]) -> dict[str, int]:
+        """Compute per-date ID counters from existing record IDs (index migration)."""
+        counters: dict[str, int] = {}
+        for record_id in ids:
+            parsed = cls._id_counter(record_id)
+            if parsed and parsed[1] > counters.get(parsed[0], 0):
+                counters[parsed[0]] = parsed[1]
+        return counters
 
     def record(
         self,
@@ -152,6 +684,7 @@ class DebugIndexManager:
         tags: list[str] | None = None,
         *,
         data: dict[str, Any] | None = None,  # Legacy parameter name for backward compatibility
+        fsync: bool = False,
     ) -> str:
         """
         Record a new debug experience.
@@ -167,12 +700,16 @@ class DebugIndexManager:
             solution: Solution that worked (when using separate args)
             tags: Optional tags for categorization
             data: Legacy parameter alias for 'context' (backward compatibility)
+            fsync: If True, fsync the record file, the index journal and the
+                storage directory before returning. Off by default:
+                records are a local knowledge cache, not a write-ahead log.
 
         Returns:
             str: The ID of the new record
         """
         record_id = self._generate_id()
-        timestamp = datetime.now().isoformat()
+        now = datetime.now()
+        timestamp = now.isoformat()
 
         # Handle 'data' as legacy alias for 'context'
         if context is None and data is not None:
@@ -207,54 +744,74 @@ class DebugIndexManager:
 
         # Save record file (compact mode for token savings)
         record_file = self.storage_dir / f"{record_id}.json"
-        with open(record_file, "w", encoding="utf-8") as f:
-            json.dump(record, f, ensure_ascii=False)
+        # Replace the reserved file atomically so a crash never leaves a truncated record
+        try:
+            replace_file_bytes(record_file, dump_json_bytes(record), fsync=fsync)
+        except BaseException:
+            record_file.unlink(missing_ok=True)  # Release the reserved ID
+            raise
 
         # Update index with compact entry
         error_type = actual_context.get("error_type", "Unknown")
-        index_entry = {
-            "id": record_id,
-            "ts": timestamp,  # Shortened key for compactness
-            "et": error_type,  # error_type shortened
-            "tags": tags[:5],  # Limit stored tags
-        }
-        self._index["records"].append(index_entry)
-
-        # Update tag inverted index
-        for tag in tags:
-            tag_lower = tag.lower()
-            if tag_lower not in self._index["tags"]:
-                self._index["tags"][tag_lower] = []
-            self._index["tags"][tag_lower].append(record_id)
-
-        # Update error type inverted index
-        et_lower = error_type.lower()
-        if et_lower not in self._index["error_types"]:
-            self._index["error_types"][et_lower] = []
-        self._index["error_types"][et_lower].append(record_id)
+        keywords = self._record_keywords(record)
+        index_entry = IndexEntry(
+            id=record_id,
+            ts=now.timestamp(),  # Epoch seconds; shorter than ISO-8601 in the index
+            et=error_type,
+            tags=tags[:5],  # Limit stored tags
+            kw=keywords,  # Cached so rebuild_keywords() needs no disk I/O
+        )
+        self._add_to_index(index_entry, tags)
+
+        # Journal the delta instead of rewriting index.json; replaying it
+        # re-derives any new tag/keyword/error-type keys. Inside batch(),
+        # index.json is written once when the batch ends instead.
+        if not self._batch_depth:
+            self._append_journal(index_entry, tags)
+            if fsync:
+                self.flush(fsync=True)
+            self._maybe_compact()
+        if fsync:
+            fsync_dir(self.storage_dir)  # One directory sync commits the record rename
+
+        # Update project metadata off the caller's path
+        _get_meta_pool().submit(self._update_meta, record_id)
 
-        # Update keyword inverted index (include error_type, error_message, tags)
-        error_message = actual_context.get("error_message", "")
-        tags_text = " ".join(tags)
-        keywords = self._extract_keywords(f"{error_type} {error_message} {cause} {solution} {tags_text}")
-        for kw in keywords:
-            if kw not in self._index["keywords"]:
-                self._index["keywords"][kw] = []
-            if record_id not in self._index["keywords"][kw]:
-                self._index["keywords"][kw].append(record_id)
+        debug_log(f"Debug record created: {record_id}")
+        return record_id
 
-        self._save_index()
-        
-        # Update project metadata
+    def _update_meta(self, record_id: str) -> None:
+        """Record a new debug entry in the project metadata (runs on the meta pool)."""
         try:
-            from .project_meta import ProjectMetaManager
-            meta = ProjectMetaManager(str(self.project_directory))
-            meta.record_debug_entry(record_id)
+            if self._meta is None:
+                self._meta = ProjectMetaManager.for_project(str(self.project_directory))
+            self._meta.record_debug_entry(record_id)
         except Exception as e:
             debug_log(f"Warning: Could not update project metadata: {e}")
 
-        debug_log(f"Debug record created: {record_id}")
-        return record_id
+    @contextmanager
+    def batch(self, fsync: bool = False) -> Iterator["DebugIndexManager"]:
+        """
+        Group many record() calls into a single index write.
+
+        Inside the block, record() still writes each record file but skips
+        the journal; index.json is saved once on exit (also if the block
+        raises). If the process dies mid-batch, rebuild_index() recovers
+        the records from their files.
+
+        Args:
+            fsync: If True, fsync index.json when the batch is saved
+
+        Yields:
+            This manager
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._save_index(fsync=fsync)
 
     def get_record(self, record_id: str) -> dict[str, Any] | None:
         """
@@ -266,17 +823,47 @@ class DebugIndexManager:
         Returns:
             The record data or None if not found
         """
-        record_file = self.storage_dir / f"{record_id}.json"
-        if not record_file.exists():
-            return None
+        # Record files are never rewritten, so a cached copy stays valid.
+        # Hand out shallow copies so callers can annotate results freely.
+        with self._record_cache_lock:
+            record = self._record_cache.get(record_id)
+            if record is not None:
+                self._record_cache.move_to_end(record_id)
+                return dict(record)
 
+        record_file = self.storage_dir / f"{record_id}.json"
         try:
-            with open(record_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            record = load_json_bytes(record_file.read_bytes())
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, IOError) as e:
             debug_log(f"Error reading record {record_id}: {e}")
             return None
 
+        with self._record_cache_lock:
+            self._record_cache[record_id] = record
+            if len(self._record_cache) > self.RECORD_CACHE_SIZE:
+                self._record_cache.popitem(last=False)
+        return dict(record)
+
+    def get_records(self, record_ids: list[str]) -> list[dict[str, Any]]:
+        """
+        Get several records by ID, reading uncached files concurrently
+        on a shared pool when there are PARALLEL_READ_MIN or more of them.
+
+        Args:
+            record_ids: The record IDs
+
+        Returns:
+            The records found, in the order of record_ids (missing IDs are skipped)
+        """
+        with self._record_cache_lock:
+            uncached = sum(rid not in self._record_cache for rid in record_ids)
+        if uncached < self.PARALLEL_READ_MIN:
+            return [r for rid in record_ids if (r := self.get_record(rid))]
+        pool = _get_read_pool(self.READ_WORKERS)
+        return [r for r in pool.map(self.get_record, record_ids) if r]
+
     def list_records(self, limit: int = 100) -> list[dict[str, Any]]:
         """
         List all records from the index.
@@ -287,17 +874,45 @@ class DebugIndexManager:
         Returns:
             List of index entries (with normalized keys)
         """
-        records = self._index["records"][-limit:]
+        return list(self._iter_entries(-limit))
+
+    def iter_records(self, limit: int | None = None) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over records in the index, oldest first.
+
+        Args:
+            limit: Only yield the most recent `limit` records (None for all)
+
+        Yields:
+            Index entries (with normalized keys), as list_records() returns them
+        """
+        return self._iter_entries(0 if limit is None else -limit)
+
+    def _iter_entries(self, start: int) -> Iterator[dict[str, Any]]:
+        """Yield normalized index entries from a row offset (negative counts from the end)."""
         # Normalize compact keys for backward compatibility
-        normalized = []
-        for r in records:
-            normalized.append({
-                "id": r.get("id"),
-                "timestamp": r.get("ts") or r.get("timestamp"),
-                "error_type": r.get("et") or r.get("error_type", "Unknown"),
-                "tags": r.get("tags", []),
-            })
-        return normalized
+        for e in self._index["columns"].rows(start):
+            yield {
+                "id": e.id,
+                "timestamp": self._format_ts(e.ts),
+                "error_type": e.et,
+                "tags": e.tags,
+            }
+
+    def list_full_records(self, limit: int = 100) -> list[dict[str, Any]]:
+        """
+        List the most recent records with full data.
+
+        Reads the newest IDs straight from the index columns and loads them
+        in one batch, without building list_records() entries first.
+
+        Args:
+            limit: Maximum number of records to return
+
+        Returns:
+            List of full records, oldest first
+        """
+        return self.get_records(self._index["columns"].id[-limit:])
 
     def search_by_keywords(self, keywords: list[str], limit: int = 10) -> list[str]:
         """
@@ -314,13 +929,17 @@ class DebugIndexManager:
         """
         import math
 
+        all_index_keywords = self._index.get("keywords", {})
+        keyword_df = self._index["keyword_df"]
+        if not all_index_keywords or not keywords:
+            return []
+
         # Expand keywords with synonyms for better recall
         expanded_keywords = self._expand_synonyms(keywords)
 
-        # Count matches per record with TF-IDF-like weighting
-        match_scores: dict[str, float] = {}
-        total_records = max(len(self._index.get("records", [])), 1)
-        all_index_keywords = self._index.get("keywords", {})
+        # Count matches per record (by posting offset) with TF-IDF-like weighting
+        match_scores: Counter[int] = Counter()
+        total_records = max(len(self._index["columns"]), 1)
 
         for kw in expanded_keywords:
             kw_lower = kw.lower()
@@ -332,19 +951,19 @@ class DebugIndexManager:
                     matching_index_keys.append(index_kw)
 
             for index_kw in matching_index_keys:
-                matching_ids = all_index_keywords[index_kw]
-                # IDF: rarer keywords get higher weight
-                idf = math.log(total_records / max(len(matching_ids), 1)) + 1
+                postings = all_index_keywords[index_kw]
+                # IDF: rarer keywords get higher weight (from the true document
+                # frequency; posting lists may be capped at MAX_POSTING)
+                df = keyword_df.get(index_kw, len(postings))
+                idf = math.log(total_records / max(df, 1)) + 1
                 # Boost original keywords over synonyms
                 boost = 2.0 if kw in keywords else 1.0
                 # Boost exact matches over substring matches
                 exact_boost = 1.5 if kw_lower == index_kw else 1.0
-                for record_id in matching_ids:
-                    match_scores[record_id] = match_scores.get(record_id, 0) + (idf * boost * exact_boost)
+                match_scores.update(dict.fromkeys(postings, idf * boost * exact_boost))
 
-        # Sort by score (descending)
-        sorted_ids = sorted(match_scores.keys(), key=lambda x: match_scores[x], reverse=True)
-        return sorted_ids[:limit]
+        # Top-k by score (heap-based, no full sort), then translate offsets to IDs
+        return self._resolve_ids([idx for idx, _ in match_scores.most_common(limit)])
 
     def search_by_tag(self, tag: str) -> list[dict[str, Any]]:
         """
@@ -356,8 +975,8 @@ class DebugIndexManager:
         Returns:
             List of matching records
         """
-        record_ids = self._index["tags"].get(tag.lower(), [])
-        return [r for rid in record_ids if (r := self.get_record(rid))]
+        record_ids = self._resolve_ids(self._index["tags"].get(tag.lower(), []))
+        return self.get_records(record_ids)
 
     def search_by_error_type(self, error_type: str) -> list[dict[str, Any]]:
         """
@@ -370,13 +989,23 @@ class DebugIndexManager:
             List of matching records
         """
         error_type_lower = error_type.lower()
-        matching_ids = self._index.get("error_types", {}).get(error_type_lower)
-        if matching_ids is None:
+        error_types = self._index.get("error_types", {})
+        columns = self._index["columns"]
+        if error_types or not columns:
+            # Union the buckets of every error type containing the query;
+            # there are far fewer distinct error types than records
+            matches: set[int] = set()
+            for et_lower, postings in error_types.items():
+                if error_type_lower in et_lower:
+                    matches.update(postings)
+            matching_ids = self._resolve_ids(sorted(matches))
+        else:
+            # Legacy index without an error_types index
             matching_ids = [
-                r["id"] for r in self._index["records"]
-                if error_type_lower in (r.get("et") or r.get("error_type", "")).lower()
+                record_id for record_id, et in zip(columns.id, columns.et)
+                if error_type_lower in et.lower()
             ]
-        return [r for rid in matching_ids if (r := self.get_record(rid))]
+        return self.get_records(matching_ids)
 
     def get_all_tags(self) -> list[str]:
         """Get all unique tags."""
@@ -384,7 +1013,7 @@ class DebugIndexManager:
 
     def get_record_count(self) -> int:
         """Get total number of records."""
-        return len(self._index["records"])
+        return len(self._index["columns"])
 
     def clear_all(self) -> None:
         """Clear all records (use with caution)."""
@@ -394,14 +1023,9 @@ class DebugIndexManager:
                 record_file.unlink()
 
         # Reset index
-        self._index = {
-            "version": 2,
-            "created_at": datetime.now().isoformat(),
-            "records": [],
-            "tags": {},
-            "keywords": {},
-            "error_types": {},
-        }
+        self._index = self._empty_index()
+        self._id_to_idx = {}
+        self._record_cache.clear()
         self._save_index()
 
         debug_log("All debug records cleared")
@@ -426,34 +1050,30 @@ class DebugIndexManager:
                         if f.name != "index.json" and not f.name.startswith("._")]
 
         # Reset index
-        new_index = {
-            "version": 3,
-            "created_at": self._index.get("created_at", datetime.now().isoformat()),
-            "rebuilt_at": datetime.now().isoformat(),
-            "records": [],
-            "tags": {},
-            "keywords": {},
-            "error_types": {},
-        }
+        new_index = self._empty_index()
+        new_index["created_at"] = self._index.get("created_at", new_index["created_at"])
+        new_index["rebuilt_at"] = datetime.now().isoformat()
 
         stats = {"records": 0, "errors": 0, "tags": 0, "keywords": 0}
 
         for record_file in sorted(record_files):
             try:
-                with open(record_file, "r", encoding="utf-8") as f:
-                    record = json.load(f)
+                record = load_json_bytes(record_file.read_bytes())
 
                 record_id = record.get("id", record_file.stem)
                 error_type = record.get("context", {}).get("error_type", "Unknown")
                 tags = record.get("tags", [])
+                keywords = self._record_keywords(record)
 
                 # Add compact index entry
-                new_index["records"].append({
-                    "id": record_id,
-                    "ts": record.get("timestamp", ""),
-                    "et": error_type,
-                    "tags": tags[:5],
-                })
+                idx = len(new_index["columns"])
+                new_index["columns"].append(IndexEntry(
+                    id=record_id,
+                    ts=self._parse_ts(record.get("timestamp", "")),
+                    et=error_type,
+                    tags=tags[:5],
+                    kw=keywords,
+                ))
                 stats["records"] += 1
 
                 # Rebuild tag inverted index
@@ -461,33 +1081,34 @@ class DebugIndexManager:
                     tag_lower = tag.lower()
                     if tag_lower not in new_index["tags"]:
                         new_index["tags"][tag_lower] = []
-                    new_index["tags"][tag_lower].append(record_id)
+                    new_index["tags"][tag_lower].append(idx)
                     stats["tags"] += 1
 
                 # Rebuild error_types inverted index
                 et_lower = error_type.lower()
                 if et_lower not in new_index["error_types"]:
                     new_index["error_types"][et_lower] = []
-                new_index["error_types"][et_lower].append(record_id)
+                new_index["error_types"][et_lower].append(idx)
 
                 # Rebuild keywords inverted index (include error_type, error_message, tags)
-                cause = record.get("cause", "")
-                solution = record.get("solution", "")
-                error_message = record.get("context", {}).get("error_message", "")
-                tags_text = " ".join(tags)
-                keywords = self._extract_keywords(f"{error_type} {error_message} {cause} {solution} {tags_text}")
                 for kw in keywords:
+                    new_index["keyword_df"][kw] = new_index["keyword_df"].get(kw, 0) + 1
                     if kw not in new_index["keywords"]:
                         new_index["keywords"][kw] = []
-                    if record_id not in new_index["keywords"][kw]:
-                        new_index["keywords"][kw].append(record_id)
+                    bucket = new_index["keywords"][kw]
+                    if not bucket or bucket[-1] != idx:
+                        bucket.append(idx)
                         stats["keywords"] += 1
 
             except (json.JSONDecodeError, IOError) as e:
                 debug_log(f"Error reading record file {record_file}: {e}")
                 stats["errors"] += 1
 
+        stats["keywords_pruned"] = self._prune_common_keywords(new_index)
+        new_index["id_counters"] = self._scan_id_counters(new_index["columns"].id)
         self._index = new_index
+        self._id_to_idx = self._map_ids(new_index["columns"].id)
+        self._record_cache.clear()
         self._save_index()
 
         debug_log(f"Index rebuilt: {stats}")
@@ -500,31 +1121,46 @@ class DebugIndexManager:
         Useful when keywords index is empty but you need keyword search.
         More efficient than full rebuild if records index is intact.
 
+        Posting lists built here are complete, except for keywords found in
+        more than MAX_KEYWORD_DF of all records, which are pruned. record()
+        trims a keyword back to its MAX_POSTING most recent records when it
+        grows past that, so run this before a search that must see every match.
+
+        Keywords are taken from the "kw" list cached in each index entry,
+        so this is a pure in-memory pass. Entries written before "kw" was
+        cached fall back to reading the record file once, and get their
+        "kw" list filled in for next time.
+
         Returns:
             Number of keywords indexed
         """
         debug_log("Rebuilding keywords index...")
 
         self._index["keywords"] = {}
+        keyword_df = self._index["keyword_df"] = {}
         keyword_count = 0
 
-        for entry in self._index["records"]:
-            record_id = entry.get("id")
-            record = self.get_record(record_id)
-            if not record:
-                continue
-
-            cause = record.get("cause", "")
-            solution = record.get("solution", "")
-            keywords = self._extract_keywords(f"{cause} {solution}")
+        columns = self._index["columns"]
+        for idx, record_id in enumerate(columns.id):
+            keywords = columns.kw[idx]
+            if keywords is None:
+                # Legacy entry: fall back to the record file
+                record = self.get_record(record_id)
+                if not record:
+                    continue
+                keywords = self._record_keywords(record)
+                columns.kw[idx] = keywords
 
             for kw in keywords:
+                keyword_df[kw] = keyword_df.get(kw, 0) + 1
                 if kw not in self._index["keywords"]:
                     self._index["keywords"][kw] = []
-                if record_id not in self._index["keywords"][kw]:
-                    self._index["keywords"][kw].append(record_id)
+                bucket = self._index["keywords"][kw]
+                if not bucket or bucket[-1] != idx:
+                    bucket.append(idx)
                     keyword_count += 1
 
+        self._prune_common_keywords(self._index)
         self._save_index()
         debug_log(f"Keywords index rebuilt: {keyword_count} keywords")
         return keyword_count
@@ -541,14 +1177,15 @@ class DebugIndexManager:
         """
         keywords_before = len(self._index.get("keywords", {}))
 
-        # Clear keywords (can be rebuilt on demand)
+        # Clear keywords and their counts (can be rebuilt on demand)
         self._index["keywords"] = {}
+        self._index["keyword_df"] = {}
 
         self._save_index()
 
         stats = {
             "keywords_removed": keywords_before,
-            "records_kept": len(self._index["records"]),
+            "records_kept": len(self._index["columns"]),
         }
         debug_log(f"Index compacted: {stats}")
         return stats
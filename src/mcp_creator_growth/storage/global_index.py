@@ -32,6 +32,11 @@ class GlobalIndexManager:
         # Load or create indexes
         self._concepts = self._load_concepts()
         self._bugs = self._load_bugs()
+        # ID lookup tables over the concept/pattern lists
+        self._concept_by_id = {c["id"]: c for c in self._concepts["concepts"]}
+        self._bug_by_id = {b["id"]: b for b in self._bugs["patterns"]}
+        # (lowercased, original) error type keys for substring search
+        self._error_type_keys = [(k.lower(), k) for k in self._bugs["by_error_type"]]
 
         debug_log(f"Global index manager initialized at {self.storage_dir}")
 
@@ -105,6 +110,7 @@ class GlobalIndexManager:
         }
 
         self._concepts["concepts"].append(concept)
+        self._concept_by_id[concept_id] = concept
 
         # Index by category
         if category not in self._concepts["by_category"]:
@@ -118,10 +124,7 @@ class GlobalIndexManager:
 
     def get_concept(self, concept_id: str) -> dict[str, Any] | None:
         """Get a concept by ID."""
-        for concept in self._concepts["concepts"]:
-            if concept["id"] == concept_id:
-                return concept
-        return None
+        return self._concept_by_id.get(concept_id)
 
     def search_concepts(self, query: str) -> list[dict[str, Any]]:
         """
@@ -184,10 +187,12 @@ class GlobalIndexManager:
         }
 
         self._bugs["patterns"].append(bug_pattern)
+        self._bug_by_id[pattern_id] = bug_pattern
 
         # Index by error type
         if error_type not in self._bugs["by_error_type"]:
             self._bugs["by_error_type"][error_type] = []
+            self._error_type_keys.append((error_type.lower(), error_type))
         self._bugs["by_error_type"][error_type].append(pattern_id)
 
         self._save_bugs()
@@ -197,10 +202,7 @@ class GlobalIndexManager:
 
     def get_bug_pattern(self, pattern_id: str) -> dict[str, Any] | None:
         """Get a bug pattern by ID."""
-        for pattern in self._bugs["patterns"]:
-            if pattern["id"] == pattern_id:
-                return pattern
-        return None
+        return self._bug_by_id.get(pattern_id)
 
     def search_bug_patterns(self, error_type: str) -> list[dict[str, Any]]:
         """
@@ -212,12 +214,15 @@ class GlobalIndexManager:
         Returns:
             List of matching patterns
         """
-        pattern_ids = self._bugs["by_error_type"].get(error_type, [])
+        by_error_type = self._bugs["by_error_type"]
+        # Copy so the stored index list is not extended with partial matches
+        pattern_ids = list(by_error_type.get(error_type, []))
 
         # Also search for partial matches
-        for err_type, ids in self._bugs["by_error_type"].items():
-            if error_type.lower() in err_type.lower() and err_type != error_type:
-                pattern_ids.extend(ids)
+        error_type_lower = error_type.lower()
+        for err_lower, err_type in self._error_type_keys:
+            if error_type_lower in err_lower and err_type != error_type:
+                pattern_ids.extend(by_error_type[err_type])
 
         return [b for pid in pattern_ids if (b := self.get_bug_pattern(pid))]
 
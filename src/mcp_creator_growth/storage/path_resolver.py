@@ -6,6 +6,7 @@ Provides intelligent path resolution for storage locations.
 Supports both project-level and global-level storage.
 """
 
+import functools
 import hashlib
 import os
 from pathlib import Path
@@ -13,7 +14,27 @@ from typing import Literal
 
 from ..debug import server_debug_log as debug_log
 
+# Storage directories already created by this process
+_ensured_dirs: set[str] = set()
 
+
+def _ensure_dir(path: Path) -> None:
+    """
+    Create a directory (and parents) once per process.
+
+    Later calls for the same path are a set lookup instead of a mkdir.
+    Two threads racing here at worst both call mkdir, which is harmless
+    with exist_ok=True. A directory removed after it was ensured is not
+    recreated, so code that deletes storage directories must remove them
+    from _ensured_dirs too.
+    """
+    key = str(path)
+    if key not in _ensured_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
+
+
+@functools.lru_cache(maxsize=1)
 def get_global_config_dir() -> Path:
     """
     Get the global configuration directory.
@@ -21,6 +42,9 @@ def get_global_config_dir() -> Path:
     On Windows: %APPDATA%/mcp-sidecar
     On Unix: ~/.config/mcp-sidecar
 
+    The environment is read once; call get_global_config_dir.cache_clear()
+    after changing APPDATA/XDG_CONFIG_HOME at runtime.
+
     Returns:
         Path to global config directory
     """
@@ -44,8 +68,41 @@ def get_project_hash(project_directory: str) -> str:
     Returns:
         A short hash identifying the project
     """
-    normalized_path = str(Path(project_directory).resolve())
-    return hashlib.md5(normalized_path.encode()).hexdigest()[:12]
+    return _hash_path(str(resolve_project_directory(project_directory)))
+
+
+@functools.lru_cache(maxsize=128)
+def _hash_path(normalized_path: str) -> str:
+    """Hash a resolved project path (memoized, so each project is hashed once)."""
+    # MD5 only tags the project's global storage directory; switching the
+    # algorithm would orphan existing projects/<hash>/ data. Flagging it as
+    # non-security use keeps it available on FIPS-restricted builds.
+    digest = hashlib.md5(normalized_path.encode("utf-8", "surrogateescape"), usedforsecurity=False)
+    return digest.hexdigest()[:12]
+
+
+def resolve_project_directory(project_directory: str) -> Path:
+    """
+    Resolve a project directory to an absolute, symlink-free path.
+
+    Memoized per absolute input path, so repeated lookups for the same
+    project skip the filesystem walk done by Path.resolve().
+
+    Args:
+        project_directory: The project root directory
+
+    Returns:
+        The resolved project path
+    """
+    # abspath() is cheap and pins relative paths to the current directory,
+    # so the cache is keyed by an absolute path
+    return _resolve_abs_path(os.path.abspath(project_directory))
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_abs_path(abs_path: str) -> Path:
+    """Resolve an absolute path (memoized; Path objects are immutable)."""
+    return Path(abs_path).resolve()
 
 
 def get_storage_path(
@@ -68,6 +125,21 @@ def get_storage_path(
     Returns:
         Path to the storage directory
     """
+    storage_path = _storage_path(project_directory, storage_type, use_global)
+
+    # Ensure directory exists
+    _ensure_dir(storage_path)
+
+    debug_log(f"Storage path resolved: {storage_path}")
+    return storage_path
+
+
+def _storage_path(
+    project_directory: str | None,
+    storage_type: Literal["sessions", "debug", "meta"],
+    use_global: bool,
+) -> Path:
+    """Compute a storage path without creating it (see get_storage_path)."""
     if use_global or project_directory is None:
         # Global storage
         global_dir = get_global_config_dir()
@@ -75,20 +147,13 @@ def get_storage_path(
         if project_directory:
             # Project-specific global storage
             project_hash = get_project_hash(project_directory)
-            storage_path = global_dir / "projects" / project_hash / storage_type
-        else:
-            # Truly global (e.g., global concepts)
-            storage_path = global_dir / "global"
-    else:
-        # Project-level storage (default)
-        project_path = Path(project_directory).resolve()
-        storage_path = project_path / ".mcp-sidecar" / storage_type
+            return global_dir / "projects" / project_hash / storage_type
+        # Truly global (e.g., global concepts)
+        return global_dir / "global"
 
-    # Ensure directory exists
-    storage_path.mkdir(parents=True, exist_ok=True)
-
-    debug_log(f"Storage path resolved: {storage_path}")
-    return storage_path
+    # Project-level storage (default)
+    project_path = resolve_project_directory(project_directory)
+    return project_path / ".mcp-sidecar" / storage_type
 
 
 def get_project_storage_path(project_directory: str) -> Path:
@@ -101,9 +166,9 @@ def get_project_storage_path(project_directory: str) -> Path:
     Returns:
         Path to {project_root}/.mcp-sidecar/
     """
-    project_path = Path(project_directory).resolve()
+    project_path = resolve_project_directory(project_directory)
     storage_path = project_path / ".mcp-sidecar"
-    storage_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(storage_path)
     return storage_path
 
 
@@ -115,10 +180,19 @@ def get_global_storage_path() -> Path:
         Path to ~/.config/mcp-sidecar/global/
     """
     storage_path = get_global_config_dir() / "global"
-    storage_path.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(storage_path)
     return storage_path
 
 
+def _dir_nonempty(path: Path) -> bool:
+    """Check whether a directory exists and has at least one entry."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
 def resolve_storage_priority(
     project_directory: str,
     storage_type: Literal["sessions", "debug"] = "debug",
@@ -135,26 +209,20 @@ def resolve_storage_priority(
     Returns:
         Tuple of (storage_path, is_project_level)
     """
-    # Try project-level first
-    project_path = get_storage_path(
-        project_directory=project_directory,
-        storage_type=storage_type,
-        use_global=False,
-    )
+    # Try project-level first. Paths are only created once chosen: a
+    # non-empty directory already exists, so probing needs no mkdir.
+    project_path = _storage_path(project_directory, storage_type, use_global=False)
 
     # Check if it has data
-    if project_path.exists() and any(project_path.iterdir()):
+    if _dir_nonempty(project_path):
         return project_path, True
 
     # Check global
-    global_path = get_storage_path(
-        project_directory=project_directory,
-        storage_type=storage_type,
-        use_global=True,
-    )
+    global_path = _storage_path(project_directory, storage_type, use_global=True)
 
-    if global_path.exists() and any(global_path.iterdir()):
+    if _dir_nonempty(global_path):
         return global_path, False
 
     # Default to project-level
+    _ensure_dir(project_path)
     return project_path, True
@@ -6,14 +6,30 @@ Manages project-level metadata stored in meta.json.
 Tracks project information, learning progress, and statistics.
 """
 
+import atexit
+import threading
+import time
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 
 from ..debug import server_debug_log as debug_log
-from .path_resolver import get_project_storage_path, get_project_hash
+from .path_resolver import get_project_storage_path, get_project_hash, resolve_project_directory
 from .serializers import load_json_file, save_json_file
 
+# Managers with unsaved changes; flushed at interpreter exit
+_pending: set["ProjectMetaManager"] = set()
+
+# Shared managers by resolved project path (see ProjectMetaManager.for_project)
+_shared: dict[str, "ProjectMetaManager"] = {}
+_shared_lock = threading.Lock()
+
+
+@atexit.register
+def _flush_pending() -> None:
+    """Write out every manager that still has unsaved metadata."""
+    for manager in list(_pending):
+        manager.flush()
+
 
 class ProjectMetaManager:
     """
@@ -26,8 +42,17 @@ class ProjectMetaManager:
     - Learning statistics
     - Debug statistics
     - Last activity timestamps
+
+    Updates are written behind: at most once per FLUSH_INTERVAL seconds
+    (a timer writes the last changes once the interval has passed), on
+    flush(), and at interpreter exit. Each write re-reads meta.json and
+    applies only this process's changes to it, so other processes sharing
+    the project (another server, the web UI) keep their counts.
     """
 
+    # Minimum seconds between automatic meta.json writes
+    FLUSH_INTERVAL = 2.0
+
     def __init__(self, project_directory: str):
         """
         Initialize the project meta manager.
@@ -35,16 +60,63 @@ class ProjectMetaManager:
         Args:
             project_directory: The project root directory
         """
-        self.project_directory = Path(project_directory).resolve()
+        self.project_directory = resolve_project_directory(project_directory)
         self.storage_dir = get_project_storage_path(str(self.project_directory))
         self.meta_file = self.storage_dir / "meta.json"
         self.project_hash = get_project_hash(str(self.project_directory))
 
-        # Load or create metadata
-        self._meta = self._load_meta()
+        # Write-behind state: updates mark the metadata dirty and are
+        # written at most every FLUSH_INTERVAL seconds (and at exit)
+        self._dirty = False
+        self._last_flush = 0.0
+        # Deferred write armed when changes are held back by FLUSH_INTERVAL
+        self._flush_timer: threading.Timer | None = None
+        # Guards the metadata dict and the write-behind state: updates from
+        # different threads, and the snapshot flush() writes. Reentrant, as
+        # updates flush while holding it.
+        self._update_lock = threading.RLock()
+        # Metadata, read from meta.json on first use (see the _meta property)
+        self._meta_data: dict[str, Any] | None = None
+        # Changes since the last write, applied to meta.json as it is on disk:
+        # statistics increments, and top-level fields set outright
+        self._stat_deltas: dict[str, float] = {}
+        self._field_changes: dict[str, Any] = {}
 
         debug_log(f"Project meta manager initialized for {self.project_directory}")
 
+    @classmethod
+    def for_project(cls, project_directory: str) -> "ProjectMetaManager":
+        """
+        Get the process-wide manager for a project, creating it on first use.
+
+        Components that update metadata share one instance, so their
+        write-behind copies cannot overwrite each other's counters.
+
+        Args:
+            project_directory: The project root directory
+
+        Returns:
+            The shared project meta manager
+        """
+        key = str(resolve_project_directory(project_directory))
+        with _shared_lock:
+            manager = _shared.get(key)
+            if manager is None:
+                manager = _shared[key] = cls(key)
+        return manager
+
+    @property
+    def _meta(self) -> dict[str, Any]:
+        """Metadata, read from meta.json on first use (hash-only callers never touch disk)."""
+        meta = self._meta_data
+        if meta is None:
+            # Load once even if the meta pool thread and a caller get here together
+            with self._update_lock:
+                meta = self._meta_data
+                if meta is None:
+                    meta = self._meta_data = self._load_meta()
+        return meta
+
     def _load_meta(self) -> dict[str, Any]:
         """Load metadata or create new one."""
         data = load_json_file(self.meta_file)
@@ -70,10 +142,74 @@ class ProjectMetaManager:
             "last_debug_record": None,
         }
 
+    def _add_stat(self, name: str, amount: float) -> None:
+        """Increment a statistics counter (call with the update lock held)."""
+        stats = self._meta["statistics"]
+        stats[name] = stats.get(name, 0) + amount
+        self._stat_deltas[name] = self._stat_deltas.get(name, 0) + amount
+
+    def _set_field(self, key: str, value: Any) -> None:
+        """Set a top-level metadata field (call with the update lock held)."""
+        self._meta[key] = value
+        # Keep a copy: later increments must not leak into the recorded change
+        self._field_changes[key] = dict(value) if isinstance(value, dict) else value
+        if key == "statistics":
+            self._stat_deltas.clear()  # Superseded by the new values
+
+    def _merge_on_disk(self) -> dict[str, Any]:
+        """Apply this process's pending changes to the current meta.json contents."""
+        data = load_json_file(self.meta_file)
+        if not data:
+            return self._meta  # Nothing on disk (or unreadable): ours is complete
+        for key, value in self._field_changes.items():
+            data[key] = dict(value) if isinstance(value, dict) else value
+        stats = data.setdefault("statistics", {})
+        for name, amount in self._stat_deltas.items():
+            stats[name] = stats.get(name, 0) + amount
+        data["updated_at"] = self._meta.get("updated_at", data.get("updated_at"))
+        return data
+
     def _save_meta(self) -> None:
-        """Save metadata to file."""
+        """Mark metadata as changed, writing it if the last write is old enough."""
         self._meta["updated_at"] = datetime.now().isoformat()
-        save_json_file(self.meta_file, self._meta)
+        self._dirty = True
+        _pending.add(self)
+        if time.monotonic() - self._last_flush > self.FLUSH_INTERVAL:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Arm a timer that writes held-back changes once FLUSH_INTERVAL has passed."""
+        with self._update_lock:
+            if self._flush_timer is not None or not self._dirty:
+                return
+            delay = self._last_flush + self.FLUSH_INTERVAL - time.monotonic()
+            self._flush_timer = threading.Timer(max(delay, 0.0), self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Write metadata to meta.json if it has unsaved changes.
+
+        Args:
+            force: Write even if nothing changed since the last write
+        """
+        with self._update_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not (self._dirty or force):
+                return
+            self._dirty = False
+            _pending.discard(self)
+            self._last_flush = time.monotonic()
+            data = self._merge_on_disk()
+            save_json_file(self.meta_file, data)
+            self._meta_data = data
+            self._stat_deltas.clear()
+            self._field_changes.clear()
 
     def get_project_hash(self) -> str:
         """Get the project hash."""
@@ -85,8 +221,9 @@ class ProjectMetaManager:
 
     def set_project_name(self, name: str) -> None:
         """Set the project name."""
-        self._meta["project_name"] = name
-        self._save_meta()
+        with self._update_lock:
+            self._set_field("project_name", name)
+            self._save_meta()
 
     def record_learning_session(
         self,
@@ -102,19 +239,19 @@ class ProjectMetaManager:
             quiz_score: Quiz score achieved
             learning_time: Time spent learning (seconds)
         """
-        stats = self._meta["statistics"]
-        stats["learning_sessions"] += 1
-        stats["total_quiz_score"] += quiz_score
-        stats["total_learning_time"] += learning_time
-
-        self._meta["last_learning_session"] = {
-            "session_id": session_id,
-            "quiz_score": quiz_score,
-            "learning_time": learning_time,
-            "completed_at": datetime.now().isoformat(),
-        }
-
-        self._save_meta()
+        with self._update_lock:
+            self._add_stat("learning_sessions", 1)
+            self._add_stat("total_quiz_score", quiz_score)
+            self._add_stat("total_learning_time", learning_time)
+
+            self._set_field("last_learning_session", {
+                "session_id": session_id,
+                "quiz_score": quiz_score,
+                "learning_time": learning_time,
+                "completed_at": datetime.now().isoformat(),
+            })
+
+            self._save_meta()
         debug_log(f"Recorded learning session: {session_id}")
 
     def record_debug_entry(self, record_id: str) -> None:
@@ -124,15 +261,15 @@ class ProjectMetaManager:
         Args:
             record_id: The debug record ID
         """
-        stats = self._meta["statistics"]
-        stats["debug_records"] += 1
+        with self._update_lock:
+            self._add_stat("debug_records", 1)
 
-        self._meta["last_debug_record"] = {
-            "record_id": record_id,
-            "recorded_at": datetime.now().isoformat(),
-        }
+            self._set_field("last_debug_record", {
+                "record_id": record_id,
+                "recorded_at": datetime.now().isoformat(),
+            })
 
-        self._save_meta()
+            self._save_meta()
         debug_log(f"Recorded debug entry: {record_id}")
 
     def get_statistics(self) -> dict[str, Any]:
@@ -170,21 +307,24 @@ class ProjectMetaManager:
         Args:
             **kwargs: Fields to update
         """
-        for key, value in kwargs.items():
-            if key not in ("version", "created_at", "project_hash"):
-                self._meta[key] = value
+        with self._update_lock:
+            for key, value in kwargs.items():
+                if key not in ("version", "created_at", "project_hash"):
+                    self._set_field(key, value)
 
-        self._save_meta()
+            self._save_meta()
 
     def reset_statistics(self) -> None:
         """Reset all statistics (use with caution)."""
-        self._meta["statistics"] = {
-            "learning_sessions": 0,
-            "debug_records": 0,
-            "total_quiz_score": 0,
-            "total_learning_time": 0,
-        }
-        self._meta["last_learning_session"] = None
-        self._meta["last_debug_record"] = None
-        self._save_meta()
+        with self._update_lock:
+            self._set_field("statistics", {
+                "learning_sessions": 0,
+                "debug_records": 0,
+                "total_quiz_score": 0,
+                "total_learning_time": 0,
+            })
+            self._set_field("last_learning_session", None)
+            self._set_field("last_debug_record", None)
+            self._save_meta()
+            self.flush(force=True)
         debug_log("Reset project statistics")
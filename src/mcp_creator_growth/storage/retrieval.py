@@ -6,11 +6,27 @@ Provides keyword matching and similarity-based search for debug records.
 Used by the debug_search tool to find relevant historical experiences.
 """
 
-import re
+import bisect
+import heapq
 from typing import Any
 
 from ..debug import server_debug_log as debug_log
-from .debug_index import DebugIndexManager
+from .debug_index import WORD_DELIMITERS, DebugIndexManager, synonym_closure
+
+# pyahocorasick is an optional speedup (pip install "mcp-creator-growth[fast]");
+# fall back to one substring scan per term when it is not installed.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # type: ignore
+
+# Only filter truly generic stop words, keep debug-related terms
+_STOP_WORDS = frozenset({
+    "a", "an", "the", "is", "are", "was", "were", "be", "been",
+    "to", "of", "in", "for", "on", "with", "at", "by", "from",
+    "and", "or", "not", "no", "as", "it", "this", "that",
+    "can", "could", "would", "should", "have", "has", "had",
+})
 
 
 class DebugRetrieval:
@@ -44,6 +60,11 @@ class DebugRetrieval:
         else:
             raise ValueError("Either index_manager or project_directory must be provided")
 
+        # Aho-Corasick automaton for the term list last passed to
+        # _count_field_matches (rebuilt when a different list comes in)
+        self._automaton: Any = None
+        self._automaton_terms: list[str] | None = None
+
     def search(
         self,
         query: str,
@@ -88,40 +109,38 @@ class DebugRetrieval:
             return []
 
         # Phase 2: Score only the candidates (not all records)
-        scored_records: list[dict[str, Any]] = []
-        for record_id in candidate_ids:
-            record = self.index_manager.get_record(record_id)
-            if not record:
+        expanded_terms = self._expand_with_synonyms(query_terms)
+        # Online top-k: min-heap of (score, -position, record). The position
+        # keeps ties in candidate order and stops comparisons reaching records.
+        top: list[tuple[float, int, dict[str, Any]]] = []
+        records = self.index_manager.get_records(list(candidate_ids)) if limit > 0 else []
+        for position, record in enumerate(records):
+            # Once the heap is full, candidates must beat its smallest score
+            min_score = top[0][0] if len(top) == limit else 0.0
+            score = self._calculate_relevance(
+                record, query, error_type, tags, expanded_terms, min_score
+            )
+            if score <= 0:
                 continue
-            score = self._calculate_relevance(record, query, error_type, tags)
-            if score > 0:
-                scored_records.append({
-                    "record": record,
-                    "score": score,
-                })
-
-        # Sort by score (descending)
-        scored_records.sort(key=lambda x: x["score"], reverse=True)
-
-        # Return top results
-        results: list[dict[str, Any]] = []
-        for item in scored_records[:limit]:
-            result_record = item["record"]
-            # Record is guaranteed to be dict[str, Any] from get_record
-            result_record["relevance_score"] = round(item["score"], 2)
-            results.append(result_record)
+            entry = (score, -position, record)
+            if len(top) < limit:
+                heapq.heappush(top, entry)
+            elif entry > top[0]:
+                heapq.heapreplace(top, entry)
+
+        # Highest score first
+        top.sort(reverse=True)
+        results: list[dict[str, Any]] = [
+            {**record, "relevance_score": round(score, 2)}
+            for score, _, record in top
+        ]
 
         debug_log(f"Found {len(results)} relevant records")
         return results
 
     def _get_all_records(self) -> list[dict[str, Any]]:
         """Get all records with full data."""
-        records = []
-        for entry in self.index_manager.list_records(limit=1000):
-            full_record = self.index_manager.get_record(entry["id"])
-            if full_record:
-                records.append(full_record)
-        return records
+        return self.index_manager.list_full_records(limit=1000)
 
     def _calculate_relevance(
         self,
@@ -129,6 +148,8 @@ class DebugRetrieval:
         query: str,
         error_type: str | None = None,
         tags: list[str] | None = None,
+        expanded_terms: list[str] | None = None,
+        min_score: float = 0.0,
     ) -> float:
         """
         Calculate relevance score for a record.
@@ -144,16 +165,17 @@ class DebugRetrieval:
             query: Search query
             error_type: Optional error type filter
             tags: Optional tag filters
+            expanded_terms: Query terms already tokenized and expanded with
+                synonyms (computed from query when omitted)
+            min_score: Score the record has to beat to be of use (e.g. the
+                lowest score in a full top-k); when even a match of every
+                term in every field could not beat it, 0.0 is returned
+                without matching
 
         Returns:
             Relevance score (0.0 to 1.0+)
         """
         score = 0.0
-        query_lower = query.lower()
-        query_terms = self._tokenize(query_lower)
-
-        # Expand query terms with synonyms for better matching
-        expanded_terms = self._expand_with_synonyms(query_terms)
 
         # Error type filter (if specified, must match)
         if error_type:
@@ -166,42 +188,51 @@ class DebugRetrieval:
         if tags:
             record_tags = set(t.lower() for t in record.get("tags", []))
             filter_tags = set(t.lower() for t in tags)
-            if not record_tags.intersection(filter_tags):
+            matched_tags = record_tags.intersection(filter_tags)
+            if not matched_tags:
                 return 0.0  # No tag match
             # Bonus for each matching tag
-            score += 0.1 * len(record_tags.intersection(filter_tags))
-
-        # Search in error type (high weight - this is often the key identifier)
-        record_error_type = record.get("context", {}).get("error_type", "").lower()
-        error_type_matches = self._count_term_matches(expanded_terms, record_error_type)
-        score += error_type_matches * 0.25
-
-        # Search in error message
-        error_message = record.get("context", {}).get("error_message", "").lower()
-        message_matches = self._count_term_matches(expanded_terms, error_message)
-        score += message_matches * 0.2
-
-        # Search in cause
-        cause = record.get("cause", "").lower()
-        cause_matches = self._count_term_matches(expanded_terms, cause)
-        score += cause_matches * 0.15
-
-        # Search in solution
-        solution = record.get("solution", "").lower()
-        solution_matches = self._count_term_matches(expanded_terms, solution)
-        score += solution_matches * 0.15
-
-        # Search in tags
-        record_tags_str = " ".join(record.get("tags", [])).lower()
-        tag_matches = self._count_term_matches(expanded_terms, record_tags_str)
-        score += tag_matches * 0.1
-
-        # Exact phrase match bonus
+            score += 0.1 * len(matched_tags)
+
+        # Filters passed; only now pay for query processing
+        query_lower = query.lower()
+        if expanded_terms is None:
+            # Expand query terms with synonyms for better matching
+            expanded_terms = self._expand_with_synonyms(self._tokenize(query_lower))
+
+        # Branch-and-bound: skip matching when the best possible score cannot
+        # beat min_score (strict, so ties are always scored)
+        if min_score and score + len(expanded_terms) * self.MAX_FIELD_WEIGHT + 0.3 < min_score:
+            return 0.0
+
+        # Score keyword hits per field in one pass over the fused fields:
+        # error type (high weight - often the key identifier), error
+        # message, cause, solution and tags
+        context = record.get("context", {})
+        fields = [
+            context.get("error_type", "").lower(),
+            context.get("error_message", "").lower(),
+            record.get("cause", "").lower(),
+            record.get("solution", "").lower(),
+            " ".join(record.get("tags", [])).lower(),
+        ]
+        field_matches = self._count_field_matches(expanded_terms, fields)
+        for matches, weight in zip(field_matches, self.FIELD_WEIGHTS):
+            score += matches * weight
+
+        # Exact phrase match bonus (error message, cause or solution)
+        _, error_message, cause, solution, _ = fields
         if query_lower in error_message or query_lower in cause or query_lower in solution:
             score += 0.3
 
         return score
 
+    # Keyword-hit weights for the fields scored by _calculate_relevance:
+    # error type, error message, cause, solution, tags
+    FIELD_WEIGHTS = (0.25, 0.2, 0.15, 0.15, 0.1)
+    # Most a single term can add when it matches every field
+    MAX_FIELD_WEIGHT = sum(FIELD_WEIGHTS)
+
     # Synonym mappings for debug-related terms (mirrors DebugIndexManager.SYNONYMS)
     SYNONYMS = {
         "bug": ["error", "exception", "issue", "problem", "fault", "defect"],
@@ -214,13 +245,14 @@ class DebugRetrieval:
         "null": ["none", "nil", "undefined", "empty"],
         "crash": ["failure", "abort", "terminate", "halt"],
     }
+    # Symmetric, transitive form of SYNONYMS used for expansion
+    _SYNONYM_CLOSURE = synonym_closure(SYNONYMS)
 
     def _expand_with_synonyms(self, terms: list[str]) -> list[str]:
         """Expand query terms with synonyms for better recall."""
         expanded = set(terms)
         for term in terms:
-            if term in self.SYNONYMS:
-                expanded.update(self.SYNONYMS[term])
+            expanded.update(self._SYNONYM_CLOSURE.get(term, ()))
         return list(expanded)
 
     def _tokenize(self, text: str) -> list[str]:
@@ -236,29 +268,75 @@ class DebugRetrieval:
         Returns:
             List of terms
         """
-        # Split on non-alphanumeric characters
-        terms = re.split(r'[^a-zA-Z0-9_]+', text.lower())
-
-        # Only filter truly generic stop words, keep debug-related terms
-        stop_words = {
-            "a", "an", "the", "is", "are", "was", "were", "be", "been",
-            "to", "of", "in", "for", "on", "with", "at", "by", "from",
-            "and", "or", "not", "no", "as", "it", "this", "that",
-            "can", "could", "would", "should", "have", "has", "had",
-        }
-
-        return [t for t in terms if len(t) >= 3 and t not in stop_words]
-
-    def _count_term_matches(self, terms: list[str], text: str) -> int:
-        """Count how many query terms appear in the text (supports substring match)."""
-        count = 0
-        text_lower = text.lower()
+        words = text.lower().translate(WORD_DELIMITERS).split()
+        return [t for t in words if len(t) >= 3 and t not in _STOP_WORDS]
+
+    def _get_automaton(self, terms: list[str]) -> Any:
+        """
+        Get an Aho-Corasick automaton matching the given terms.
+
+        search() passes the same expanded term list for every candidate, so
+        the automaton is built once per search; callers must not mutate a
+        term list in place between calls.
+        """
+        if terms is not self._automaton_terms:
+            automaton = ahocorasick.Automaton()
+            for term in terms:
+                term_lower = term.lower()
+                automaton.add_word(term_lower, term_lower)
+            automaton.make_automaton()
+            self._automaton = automaton
+            self._automaton_terms = terms
+        return self._automaton
+
+    def _count_field_matches(self, terms: list[str], fields: list[str]) -> list[int]:
+        """
+        Count how many query terms appear in each field (supports substring match).
+
+        The lowercased fields are joined into one blob and scanned in a
+        single pass, with field boundaries tracked by offset. The separator
+        never occurs in a term, so a match cannot span two fields.
+
+        Args:
+            terms: Query terms
+            fields: Lowercased field texts
+
+        Returns:
+            Number of distinct terms found in each field
+        """
+        counts = [0] * len(fields)
+        if not terms:
+            return counts
+
+        starts = []
+        offset = 0
+        for field in fields:
+            starts.append(offset)
+            offset += len(field) + 1
+        blob = "\x01".join(fields)
+
+        if ahocorasick is not None:
+            # One scan of the blob; iter() yields the end offset of each hit
+            hits = {
+                (bisect.bisect_right(starts, end) - 1, term)
+                for end, term in self._get_automaton(terms).iter(blob)
+            }
+            for field_idx, _ in hits:
+                counts[field_idx] += 1
+            return counts
+
+        last_field = len(fields) - 1
         for term in terms:
             term_lower = term.lower()
-            # Check for exact word match or substring match
-            if term_lower in text_lower:
-                count += 1
-        return count
+            pos = blob.find(term_lower)
+            while pos != -1:
+                field_idx = bisect.bisect_right(starts, pos) - 1
+                counts[field_idx] += 1
+                if field_idx == last_field:
+                    break
+                # Each field counts a term once; resume at the next field
+                pos = blob.find(term_lower, starts[field_idx + 1])
+        return counts
 
     def search_similar_errors(
         self,
@@ -294,12 +372,7 @@ class DebugRetrieval:
         Returns:
             List of recent records
         """
-        records = []
-        for entry in self.index_manager.list_records(limit=limit):
-            full_record = self.index_manager.get_record(entry["id"])
-            if full_record:
-                records.append(full_record)
-        return records
+        return self.index_manager.list_full_records(limit=limit)
 
 
 # Alias for test compatibility
@@ -7,28 +7,78 @@ Handles sessions, debug records, and metadata.
 """
 
 import json
+import mmap
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from ..debug import server_debug_log as debug_log
 
+# orjson is an optional speedup (pip install "mcp-creator-growth[fast]");
+# fall back to the stdlib json module when it is not installed.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# pysimdjson (also in the "fast" extra) parses JSON without building
+# Python objects; used where only validity or a few fields matter.
+try:
+    import simdjson
+except ImportError:
+    simdjson = None  # type: ignore
+
+
+class _ConverterTable(dict):
+    """Maps a value's type to its storage converter (None for pass-through).
+
+    Types are resolved with issubclass on first sight and cached, so
+    converting a value costs one dict lookup on type(value).
+    """
+
+    def __missing__(self, cls: type) -> Any:
+        converter: Any = None
+        if issubclass(cls, datetime):
+            converter = cls.isoformat
+        elif issubclass(cls, Path):
+            converter = str
+        self[cls] = converter
+        return converter
+
+
+# Converters for values JSON cannot store directly (datetime, Path)
+_CONVERTERS = _ConverterTable()
+
+
+def _json_default(obj: Any, _converters: _ConverterTable = _CONVERTERS) -> Any:
+    """
+    Convert a value JSON cannot store directly (the `default` hook for both backends).
+
+    A plain function avoids the JSONEncoder.default method dispatch; the
+    converter table is bound as a default argument to skip a global lookup.
+    """
+    converter = _converters[type(obj)]
+    if converter is not None:
+        return converter(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class DateTimeEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles datetime objects."""
 
     def default(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, Path):
-            return str(obj)
-        return super().default(obj)
+        return _json_default(obj)
 
 
 def serialize_to_json(data: dict[str, Any], pretty: bool = False) -> str:
     """
     Serialize data to JSON string.
 
+    Compact output has no spaces after separators (``{"a":1,"b":2}``),
+    whether or not orjson is installed.
+
     Args:
         data: Data to serialize
         pretty: If True, format with indentation (default: False for compactness)
@@ -36,13 +86,253 @@ def serialize_to_json(data: dict[str, Any], pretty: bool = False) -> str:
     Returns:
         JSON string
     """
-    indent = 2 if pretty else None
-    return json.dumps(
-        data,
-        cls=DateTimeEncoder,
-        ensure_ascii=False,
-        indent=indent,
-    )
+    return dump_json_bytes(data, pretty=pretty).decode("utf-8")
+
+
+# Serializer settings built once: orjson option masks, and stdlib encoders
+# (json.dumps with cls= constructs a new encoder on every call).
+# OPT_NON_STR_KEYS writes int/float/bool/None dict keys as strings, as json does;
+# the compact stdlib encoder omits separator spaces, as orjson does.
+_ORJSON_COMPACT = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+_ORJSON_PRETTY = _ORJSON_COMPACT | orjson.OPT_INDENT_2 if orjson is not None else 0
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_json_default)
+_PRETTY_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2, default=_json_default)
+
+
+def dump_json_bytes(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON bytes.
+
+    Uses orjson when available, otherwise the stdlib json module. Datetime
+    and Path values are written as ISO strings and plain paths. Data orjson
+    rejects (integers wider than 64 bits, keys of unsupported types) is
+    passed to the stdlib encoder instead. Note that orjson writes NaN and
+    infinities as null, while the stdlib writes them as NaN/Infinity.
+
+    Args:
+        data: Data to serialize
+        pretty: If True, format with indentation (default: False for compactness)
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        option = _ORJSON_PRETTY if pretty else _ORJSON_COMPACT
+        try:
+            return orjson.dumps(data, default=_json_default, option=option)
+        except (TypeError, OverflowError):
+            pass  # orjson.JSONEncodeError subclasses TypeError; retry with json
+    encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+    return encoder.encode(data).encode("utf-8")
+
+
+def load_json_bytes(data: bytes | bytearray | memoryview) -> Any:
+    """
+    Parse UTF-8 encoded JSON from a bytes-like object.
+
+    Uses orjson when available (which parses buffers such as a memoryview
+    over an mmap without copying), otherwise the stdlib json module.
+
+    Args:
+        data: UTF-8 encoded JSON
+
+    Returns:
+        Parsed data
+
+    Raises:
+        json.JSONDecodeError: If JSON is invalid
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def new_json_parser() -> Any:
+    """
+    Create a reusable parser for json_bytes_has_content()/load_json_fields().
+
+    A parser is not thread-safe; use one per thread.
+
+    Returns:
+        A simdjson.Parser, or None when pysimdjson is not installed
+    """
+    return simdjson.Parser() if simdjson is not None else None
+
+
+def json_bytes_has_content(data: bytes, parser: Any = None) -> bool:
+    """
+    Check that UTF-8 encoded JSON parses to a non-empty value.
+
+    With a parser from new_json_parser(), objects and arrays are only
+    validated and sized, never converted to Python objects; reusing one
+    parser across calls also reuses its buffers. Without one, the data is
+    parsed with load_json_bytes().
+
+    Args:
+        data: UTF-8 encoded JSON
+        parser: Optional parser from new_json_parser()
+
+    Returns:
+        True if the value is not empty/null/false
+
+    Raises:
+        ValueError: If JSON is invalid (json.JSONDecodeError is a ValueError)
+    """
+    if parser is None:
+        return bool(load_json_bytes(data))
+    doc = parser.parse(data)
+    if isinstance(doc, (simdjson.Object, simdjson.Array)):
+        # Sized here so the document is released before the parser is reused
+        return len(doc) > 0
+    return bool(doc)
+
+
+def load_json_fields(data: bytes, keys: tuple[str, ...], parser: Any = None) -> dict[str, Any] | None:
+    """
+    Parse a UTF-8 encoded JSON object, keeping only some top-level fields.
+
+    With a parser from new_json_parser(), only the requested fields are
+    converted to Python objects; the rest of the document is validated
+    but never materialized. Without one, the data is fully parsed with
+    load_json_bytes() and the fields are picked from the result.
+
+    Args:
+        data: UTF-8 encoded JSON
+        keys: Top-level keys to extract (missing keys are left out)
+        parser: Optional parser from new_json_parser()
+
+    Returns:
+        The requested fields, or None if the JSON is not a non-empty object
+
+    Raises:
+        ValueError: If JSON is invalid (json.JSONDecodeError is a ValueError)
+    """
+    if parser is None:
+        obj = load_json_bytes(data)
+        if not obj or not isinstance(obj, dict):
+            return None
+        return {key: obj[key] for key in keys if key in obj}
+
+    doc = parser.parse(data)
+    if not isinstance(doc, simdjson.Object) or not len(doc):
+        return None
+    fields = {}
+    for key in keys:
+        try:
+            value = doc[key]
+        except KeyError:
+            continue
+        # Convert nested proxies so nothing refers to the parser's buffers
+        if isinstance(value, simdjson.Object):
+            value = value.as_dict()
+        elif isinstance(value, simdjson.Array):
+            value = value.as_list()
+        fields[key] = value
+    return fields
+
+
+# Files at least this large are parsed from a memory map instead of read()
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+
+def read_json_bytes_file(file_path: Path, mmap_threshold: int = MMAP_THRESHOLD_BYTES) -> Any:
+    """
+    Read and parse a JSON file without going through a text file handle.
+
+    Small files are read with a single read(). Files of at least
+    mmap_threshold bytes are memory-mapped and parsed straight from the
+    page cache, which saves the read() copy when orjson is available.
+
+    Caveat: a mapping sees later writes to the same inode. If another
+    process truncates the file while it is being parsed, access past the
+    new end raises SIGBUS, so writers should replace files (see
+    replace_file_bytes) rather than rewrite them in place.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        Parsed data
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        json.JSONDecodeError: If JSON is invalid
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < mmap_threshold:
+            return load_json_bytes(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return load_json_bytes(view)
+
+
+def write_file_bytes(file_path: Path | str, data: bytes, fsync: bool = False) -> None:
+    """
+    Write bytes to a file with a single unbuffered write.
+
+    Skips the buffered file-object layer of open(); useful for small
+    machine-written files that are produced as one bytes payload.
+
+    Args:
+        file_path: Path of the file to (over)write
+        data: Payload to write
+        fsync: If True, fsync the file before closing (default: False)
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    flags |= getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+    fd = os.open(file_path, flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def replace_file_bytes(file_path: Path, data: bytes, fsync: bool = False) -> None:
+    """
+    Atomically replace a file's contents.
+
+    The payload is written to a temporary sibling which is then renamed
+    over the target with os.replace(), so readers see either the old or
+    the new file, never a truncated one.
+
+    Args:
+        file_path: Path of the file to replace
+        data: Payload to write
+        fsync: If True, fsync the data before the rename. The rename itself
+            is only durable once the directory is synced (see fsync_dir)
+    """
+    # Unique per process and thread: meta.json is also replaced from a background thread
+    tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        write_file_bytes(tmp_path, data, fsync=fsync)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def fsync_dir(dir_path: Path) -> None:
+    """
+    Flush a directory entry table to disk, committing earlier renames.
+
+    A no-op on platforms that cannot open directories (Windows).
+
+    Args:
+        dir_path: Directory to sync
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
 
 def deserialize_from_json(json_str: str) -> dict[str, Any]:
@@ -58,6 +348,8 @@ def deserialize_from_json(json_str: str) -> dict[str, Any]:
     Raises:
         json.JSONDecodeError: If JSON is invalid
     """
+    if orjson is not None:
+        return orjson.loads(json_str)
     return json.loads(json_str)
 
 
@@ -65,26 +357,24 @@ def save_json_file(
     file_path: Path | str,
     data: dict[str, Any],
     pretty: bool = False,
+    fsync: bool = False,
 ) -> None:
     """
     Save data to a JSON file.
 
+    The file is replaced atomically, so a crash mid-write leaves the
+    previous contents rather than a truncated file.
+
     Args:
         file_path: Path to save the file
         data: Data to save
         pretty: If True, format with indentation (default: False for compactness)
+        fsync: If True, fsync the data before the rename (default: False)
     """
     file_path = Path(file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(
-            data,
-            f,
-            cls=DateTimeEncoder,
-            ensure_ascii=False,
-            indent=2 if pretty else None,
-        )
+    replace_file_bytes(file_path, dump_json_bytes(data, pretty=pretty), fsync=fsync)
 
     debug_log(f"Saved JSON file: {file_path}")
 
@@ -93,6 +383,8 @@ def load_json_file(file_path: Path | str) -> dict[str, Any] | None:
     """
     Load data from a JSON file.
 
+    Large files are memory-mapped rather than read (see read_json_bytes_file).
+
     Args:
         file_path: Path to the JSON file
 
@@ -101,12 +393,11 @@ def load_json_file(file_path: Path | str) -> dict[str, Any] | None:
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
-        return None
-
+    # A missing file surfaces from the read itself; no separate exists() stat
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return read_json_bytes_file(file_path)
+    except FileNotFoundError:
+        return None
     except json.JSONDecodeError as e:
         debug_log(f"Error parsing JSON file {file_path}: {e}")
         return None
@@ -134,12 +425,8 @@ def serialize_session(session_data: dict[str, Any]) -> dict[str, Any]:
 
     # Copy all session fields
     for key, value in session_data.items():
-        if isinstance(value, datetime):
-            serialized[key] = value.isoformat()
-        elif isinstance(value, Path):
-            serialized[key] = str(value)
-        else:
-            serialized[key] = value
+        converter = _CONVERTERS[type(value)]
+        serialized[key] = value if converter is None else converter(value)
 
     return serialized
 
@@ -183,15 +470,25 @@ def merge_data(
         Merged data
     """
     result = existing.copy()
-
-    for key, value in new.items():
-        if key not in result or overwrite:
-            result[key] = value
-        elif isinstance(result[key], dict) and isinstance(value, dict):
-            # Recursively merge dicts
-            result[key] = merge_data(result[key], value, overwrite)
-        elif isinstance(result[key], list) and isinstance(value, list):
-            # Extend lists
-            result[key] = result[key] + value
+    if overwrite:
+        result.update(new)
+        return result
+
+    # Merge nested dicts level by level from a worklist instead of recursing.
+    # Each level is a fresh copy, so neither input is modified.
+    stack = [(result, new)]
+    while stack:
+        merged, incoming = stack.pop()
+        for key, value in incoming.items():
+            if key not in merged:
+                merged[key] = value
+                continue
+            current = merged[key]
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged[key] = current.copy()
+                stack.append((merged[key], value))
+            elif isinstance(current, list) and isinstance(value, list):
+                # Extend lists (into a new list; the existing one may be shared)
+                merged[key] = current + value
 
     return result
@@ -6,16 +6,69 @@ Manages persistence of learning sessions to disk.
 Sessions are stored in {project}/.mcp-sidecar/sessions/
 """
 
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
 from ..debug import server_debug_log as debug_log
-from .path_resolver import get_storage_path
-from .serializers import save_json_file, load_json_file
+from .path_resolver import get_storage_path, resolve_project_directory
+from .serializers import (
+    dump_json_bytes,
+    fsync_dir,
+    json_bytes_has_content,
+    load_json_bytes,
+    load_json_fields,
+    load_json_file,
+    new_json_parser,
+    replace_file_bytes,
+    save_json_file,
+)
 from .project_meta import ProjectMetaManager
 
 
+@dataclass(slots=True, eq=False)
+class SessionEntry:
+    """
+    Compact in-memory index entry for one session.
+
+    Slotted to keep per-session overhead low; converted to a plain dict
+    (with the short on-disk keys) only when the index is written.
+    Compared by identity, so removing an entry from the index list does
+    not compare field by field.
+    """
+    sid: str   # session_id
+    fn: str    # filename
+    ts: str    # saved_at
+    qs: int    # quiz_score
+    t: float   # time_spent
+    sp: str    # summary_preview
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SessionEntry":
+        """Build an entry from its on-disk form (supports legacy long keys)."""
+        return cls(
+            sid=data.get("sid") or data.get("session_id", ""),
+            fn=data.get("fn") or data.get("filename", ""),
+            ts=data.get("ts") or data.get("saved_at", ""),
+            qs=data.get("qs") or data.get("quiz_score", 0),
+            t=data.get("t") or data.get("time_spent", 0),
+            sp=data.get("sp") or data.get("summary_preview", ""),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the compact on-disk form."""
+        return {"sid": self.sid, "fn": self.fn, "ts": self.ts, "qs": self.qs, "t": self.t, "sp": self.sp}
+
+
 class SessionStorageManager:
     """
     Manages learning session persistence.
@@ -23,9 +76,27 @@ class SessionStorageManager:
     Storage structure:
     {project}/.mcp-sidecar/sessions/
     ├── index.json              # Session index for quick lookup
+    ├── index.log               # Journal of index changes since last index.json write
     ├── 20260118_abc123.json    # Individual session files
     └── 20260118_def456.json
     """
+
+    # Index schema version (2: every entry uses the compact keys)
+    INDEX_VERSION = 2
+
+    # Rewrite index.json (and truncate the journal) once the journal exceeds this size
+    JOURNAL_COMPACT_BYTES = 64 * 1024
+
+    # Threads used to read session files for export/rebuild, and how many
+    # files are in flight at once (bounds memory for large histories)
+    READ_WORKERS = 8
+    READ_WINDOW = 64
+
+    # Number of parsed session files kept in memory (least recently used are dropped)
+    SESSION_CACHE_SIZE = 32
+
+    # Session file fields an index entry is built from
+    REBUILD_FIELDS = ("session_id", "saved_at", "summary", "results")
     
     def __init__(self, project_directory: str):
         """
@@ -34,19 +105,35 @@ class SessionStorageManager:
         Args:
             project_directory: The project root directory
         """
-        self.project_directory = Path(project_directory).resolve()
+        self.project_directory = resolve_project_directory(project_directory)
+        # String form for records and meta lookups (Path.__str__ re-joins it)
+        self._project_directory_str = str(self.project_directory)
         self.storage_dir = get_storage_path(
-            project_directory=str(self.project_directory),
+            project_directory=self._project_directory_str,
             storage_type="sessions",
             use_global=False,
         )
         self.index_file = self.storage_dir / "index.json"
+        self.journal_file = self.storage_dir / "index.log"
+        self._journal_bytes = 0
+        # Whether the journal ends in a torn line (next append starts a new line)
+        self._journal_torn = False
         
         # Ensure storage directory exists
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         
         # Load or create index
         self._index = self._load_index()
+        self._build_lookup()
+        self._replay_journal()
+        # Nesting depth of batch() blocks; index writes are deferred while > 0
+        self._batch_depth = 0
+        # Whether the in-memory index has changes not yet written
+        self._dirty = False
+        # Project metadata manager, created on the first save_session()
+        self._meta: ProjectMetaManager | None = None
+        # Parsed session files by filename, least recently used first
+        self._session_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
         
         debug_log(f"Session storage initialized at: {self.storage_dir}")
     
@@ -54,10 +141,13 @@ class SessionStorageManager:
         """Load the session index or create a new one."""
         data = load_json_file(self.index_file)
         if data:
+            # Older indexes may mix full-key and compact entries
+            data["sessions"] = [SessionEntry.from_dict(entry) for entry in data["sessions"]]
+            data["version"] = self.INDEX_VERSION
             return data
         
         return {
-            "version": 1,
+            "version": self.INDEX_VERSION,
             "created_at": datetime.now().isoformat(),
             "sessions": [],
             "statistics": {
@@ -67,11 +157,207 @@ class SessionStorageManager:
             },
         }
     
-    def _save_index(self) -> None:
-        """Save the session index."""
-        self._index["updated_at"] = datetime.now().isoformat()
-        save_json_file(self.index_file, self._index)
+    def _build_lookup(self) -> None:
+        """Rebuild the in-memory lookups over the session index entries."""
+        # Session ID -> index entry (first entry wins, like a linear scan)
+        self._id_to_entry: dict[str, SessionEntry] = {}
+        # Filename date prefix (YYYYMMDD) -> index entries, in index order
+        self._by_date: dict[str, list[SessionEntry]] = {}
+        # Session IDs that appear on more than one index entry
+        self._duplicate_ids: set[str] = set()
+        for entry in self._index["sessions"]:
+            self._add_to_lookup(entry)
+
+    def _add_to_lookup(self, entry: SessionEntry) -> None:
+        """Add one index entry to the in-memory lookups."""
+        if self._id_to_entry.setdefault(entry.sid, entry) is not entry:
+            self._duplicate_ids.add(entry.sid)
+        self._by_date.setdefault(entry.fn[:8], []).append(entry)
+
+    def _drop_from_lookup(self, entry: SessionEntry) -> None:
+        """Remove one index entry (already gone from the index) from the lookups."""
+        day = self._by_date[entry.fn[:8]]
+        day.remove(entry)
+        if not day:
+            del self._by_date[entry.fn[:8]]
+
+        session_id = entry.sid
+
+        del self._id_to_entry[session_id]
+        if session_id in self._duplicate_ids:
+            # The next entry with this ID takes over; only duplicates pay for the scan
+            self._duplicate_ids.discard(session_id)
+            matches = [
+                other for other in self._index["sessions"]
+                if other.sid == session_id
+            ]
+            if matches:
+                self._id_to_entry[session_id] = matches[0]
+                if len(matches) > 1:
+                    self._duplicate_ids.add(session_id)
+
+    def _add_entry(self, entry: SessionEntry) -> None:
+        """Append an index entry and count it in the statistics."""
+        self._index["sessions"].append(entry)
+        self._add_to_lookup(entry)
+
+        stats = self._index["statistics"]
+        stats["total_sessions"] += 1
+        stats["total_quiz_score"] += entry.qs
+        stats["total_time_spent"] += entry.t
+
+    def _remove_entry(self, session_id: str) -> SessionEntry | None:
+        """Remove the index entry for a session and uncount it; returns the entry."""
+        found = self._id_to_entry.get(session_id)
+        if found is None:
+            return None
+
+        # Entries compare by identity, so list.remove() finds exactly this one
+        self._index["sessions"].remove(found)
+        self._drop_from_lookup(found)
+
+        # Update statistics
+        stats = self._index["statistics"]
+        stats["total_sessions"] -= 1
+        stats["total_quiz_score"] -= found.qs
+        stats["total_time_spent"] -= found.t
+        return found
+
+    def _log_change(self, delta: dict[str, Any], now_iso: str | None = None) -> None:
+        """
+        Record an index change by appending it to the journal.
+
+        Inside a batch() block nothing is appended; the whole index is
+        written when the block exits.
+
+        Args:
+            delta: {"add": index_entry} or {"del": session_id}
+            now_iso: Current time as an ISO string, if the caller already has it
+        """
+        self._index["updated_at"] = now_iso or datetime.now().isoformat()
+        if self._batch_depth:
+            self._dirty = True
+            return
+
+        # Sequence numbers above the one saved in index.json mark journal
+        # lines that still have to be replayed
+        seq = self._index.get("seq", 0) + 1
+        self._index["seq"] = seq
+        line = dump_json_bytes({"seq": seq, **delta}) + b"\n"
+        if self._journal_torn:
+            line = b"\n" + line
+            self._journal_torn = False
+        with open(self.journal_file, "ab") as f:
+            f.write(line)
+
+        self._journal_bytes += len(line)
+        if self._journal_bytes > self.JOURNAL_COMPACT_BYTES:
+            self._save_index(now_iso)
+
+    def _replay_journal(self) -> None:
+        """Apply journaled changes that are not yet part of index.json."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+
+        self._journal_torn = bool(lines) and not lines[-1].endswith(b"\n")
+        saved_seq = self._index.get("seq", 0)
+        replayed = 0
+        for line in lines:
+            self._journal_bytes += len(line)
+            try:
+                delta = load_json_bytes(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted append
+                debug_log("Skipping unreadable session index journal line")
+                continue
+            seq = delta.get("seq", 0)
+            if seq <= saved_seq:
+                continue  # Already saved into index.json
+            if "add" in delta:
+                self._add_entry(SessionEntry.from_dict(delta["add"]))
+            elif "del" in delta:
+                self._remove_entry(delta["del"])
+            self._index["seq"] = max(self._index.get("seq", 0), seq)
+            replayed += 1
+
+        if replayed:
+            debug_log(f"Replayed {replayed} session index journal entries")
+
+    def _save_index(self, now_iso: str | None = None) -> None:
+        """
+        Save the whole session index (folding in the journal).
+
+        Inside a batch() block the write is deferred until the block exits.
+
+        Args:
+            now_iso: Current time as an ISO string, if the caller already has it
+        """
+        self._index["updated_at"] = now_iso or datetime.now().isoformat()
+        self._dirty = True
+        if not self._batch_depth:
+            self.flush()
+
+    def flush(self, fsync: bool = False) -> None:
+        """
+        Write the session index if it has unsaved changes.
+
+        Args:
+            fsync: If True, also fold in any journaled changes and make the
+                new index.json durable before the journal is removed
+        """
+        if self._dirty or (fsync and self._journal_bytes):
+            self._dirty = False
+            data = {**self._index, "sessions": [entry.to_dict() for entry in self._index["sessions"]]}
+            save_json_file(self.index_file, data, fsync=fsync)
+            if fsync:
+                fsync_dir(self.storage_dir)
+            # index.json now holds every journaled change
+            self.journal_file.unlink(missing_ok=True)
+            self._journal_bytes = 0
+            self._journal_torn = False
+
+    @contextmanager
+    def batch(self) -> Iterator["SessionStorageManager"]:
+        """
+        Group many session saves/deletes into a single index write.
+
+        Inside the block, session files are still written immediately but
+        nothing is journaled; index.json is saved once on exit (also if the block raises). If the
+        process dies mid-batch, rebuild_index() recovers the sessions from
+        their files.
+
+        Yields:
+            This manager
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
     
+    def _read_concurrently(
+        self,
+        read: Callable[[Path], Any],
+        paths: list[Path],
+    ) -> Iterator[tuple[Path, Future]]:
+        """
+        Read files on a thread pool, yielding (path, future) pairs in order.
+
+        Each future's result() returns read(path) or raises its error, so
+        callers keep per-file error handling.
+        """
+        if not paths:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.READ_WORKERS, len(paths))) as pool:
+            for start in range(0, len(paths), self.READ_WINDOW):
+                window = paths[start:start + self.READ_WINDOW]
+                yield from zip(window, [pool.submit(read, path) for path in window])
+
     def save_session(
         self,
         session_id: str,
@@ -94,13 +380,15 @@ class SessionStorageManager:
             Path to saved session file
         """
         timestamp = datetime.now()
+        now_iso = timestamp.isoformat()
+        summary = session_data.get("summary", "")
         
         # Build session record
         record = {
             "session_id": session_id,
-            "saved_at": timestamp.isoformat(),
-            "project_directory": str(self.project_directory),
-            "summary": session_data.get("summary", ""),
+            "saved_at": now_iso,
+            "project_directory": self._project_directory_str,
+            "summary": summary,
             "reasoning": session_data.get("reasoning", {}),
             "quizzes": session_data.get("quizzes", []),
             "focus_areas": session_data.get("focus_areas", []),
@@ -110,8 +398,8 @@ class SessionStorageManager:
                 "answers": answers or [],
             },
             "metadata": {
-                "created_at": session_data.get("created_at", timestamp.isoformat()),
-                "completed_at": timestamp.isoformat(),
+                "created_at": session_data.get("created_at", now_iso),
+                "completed_at": now_iso,
             },
         }
         
@@ -121,43 +409,34 @@ class SessionStorageManager:
         filename = f"{date_str}_{short_id}.json"
         session_file = self.storage_dir / filename
         
-        # Save session file
-        save_json_file(session_file, record)
-        
-        # Update index with compact keys for token savings
-        # Keys: sid=session_id, fn=filename, ts=saved_at, qs=quiz_score, t=time_spent, sp=summary_preview
-        index_entry = {
-            "sid": session_id,
-            "fn": filename,
-            "ts": timestamp.isoformat(),
-            "qs": quiz_score,
-            "t": time_spent,
-            "sp": session_data.get("summary", "")[:50],  # Reduced preview length
-        }
-        self._index["sessions"].append(index_entry)
-        
-        # Update statistics
-        stats = self._index["statistics"]
-        stats["total_sessions"] += 1
-        stats["total_quiz_score"] += quiz_score
-        stats["total_time_spent"] += time_spent
+        # Save session file (storage_dir was created in __init__, so skip
+        # save_json_file's per-call mkdir)
+        replace_file_bytes(session_file, dump_json_bytes(record))
+        self._session_cache.pop(filename, None)  # A same-day short ID may overwrite a file
         
-        self._save_index()
+        # Update index (stored with compact keys for token savings)
+        index_entry = SessionEntry(
+            sid=session_id,
+            fn=filename,
+            ts=now_iso,
+            qs=quiz_score,
+            t=time_spent,
+            sp=summary[:50],  # Reduced preview length
+        )
+        self._add_entry(index_entry)
+        self._log_change({"add": index_entry.to_dict()}, now_iso)
         
         # Update project metadata
         try:
-            meta_manager = ProjectMetaManager(str(self.project_directory))
-            meta_manager.record_learning_session(session_id, quiz_score, time_spent)
+            if self._meta is None:
+                self._meta = ProjectMetaManager.for_project(self._project_directory_str)
+            self._meta.record_learning_session(session_id, quiz_score, time_spent)
         except Exception as e:
             debug_log(f"Failed to update project meta: {e}")
         
         debug_log(f"Session saved: {filename}")
         return str(session_file)
     
-    def _get_entry_field(self, entry: dict, field: str, short: str, default: Any = None) -> Any:
-        """Get field from entry, supporting both old and new key formats."""
-        return entry.get(short) or entry.get(field, default)
-
     def load_session(self, session_id: str) -> dict[str, Any] | None:
         """
         Load a session by ID.
@@ -168,15 +447,24 @@ class SessionStorageManager:
         Returns:
             Session data or None if not found
         """
-        # Find in index (supports both old "session_id" and new "sid" keys)
-        for entry in self._index["sessions"]:
-            entry_sid = self._get_entry_field(entry, "session_id", "sid")
-            if entry_sid == session_id:
-                filename = self._get_entry_field(entry, "filename", "fn")
-                session_file = self.storage_dir / filename
-                return load_json_file(session_file)
-
-        return None
+        entry = self._id_to_entry.get(session_id)
+        if entry is None:
+            return None
+
+        # Session files only change through this manager, which evicts them
+        # on write. Hand out shallow copies so callers can annotate results.
+        session = self._session_cache.get(entry.fn)
+        if session is not None:
+            self._session_cache.move_to_end(entry.fn)
+            return dict(session)
+
+        session = load_json_file(self.storage_dir / entry.fn)
+        if session is None:
+            return None
+        self._session_cache[entry.fn] = session
+        if len(self._session_cache) > self.SESSION_CACHE_SIZE:
+            self._session_cache.popitem(last=False)
+        return dict(session)
     
     def list_sessions(self, limit: int = 50) -> list[dict[str, Any]]:
         """
@@ -188,21 +476,36 @@ class SessionStorageManager:
         Returns:
             List of session index entries (most recent first), normalized to full keys
         """
-        sessions = self._index["sessions"][-limit:]
-        sessions.reverse()  # Most recent first
-
-        # Normalize to full keys for backward compatibility in API responses
-        normalized = []
-        for entry in sessions:
-            normalized.append({
-                "session_id": self._get_entry_field(entry, "session_id", "sid"),
-                "filename": self._get_entry_field(entry, "filename", "fn"),
-                "saved_at": self._get_entry_field(entry, "saved_at", "ts"),
-                "quiz_score": self._get_entry_field(entry, "quiz_score", "qs", 0),
-                "time_spent": self._get_entry_field(entry, "time_spent", "t", 0),
-                "summary_preview": self._get_entry_field(entry, "summary_preview", "sp", ""),
-            })
-        return normalized
+        sessions = self._index["sessions"]
+        if limit > 0:
+            # Walk back from the newest entry instead of copying a slice
+            recent = islice(reversed(sessions), limit)
+        else:
+            # Keep the slice semantics for non-positive limits ([-0:] is everything)
+            recent = reversed(sessions[-limit:])
+
+        return [self._normalize_entry(entry) for entry in recent]  # Most recent first
+
+    def iter_sessions(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over all sessions, most recent first.
+
+        Yields:
+            Session index entries, normalized as list_sessions() returns them
+        """
+        for entry in reversed(self._index["sessions"]):
+            yield self._normalize_entry(entry)
+
+    def _normalize_entry(self, entry: SessionEntry) -> dict[str, Any]:
+        """Expand an index entry to full keys for backward compatibility in API responses."""
+        return {
+            "session_id": entry.sid,
+            "filename": entry.fn,
+            "saved_at": entry.ts,
+            "quiz_score": entry.qs,
+            "time_spent": entry.t,
+            "summary_preview": entry.sp,
+        }
     
     def get_session_by_date(self, date: str) -> list[dict[str, Any]]:
         """
@@ -214,34 +517,31 @@ class SessionStorageManager:
         Returns:
             List of sessions for that date (normalized keys)
         """
-        results = []
-        for entry in self._index["sessions"]:
-            filename = self._get_entry_field(entry, "filename", "fn", "")
-            if filename.startswith(date):
-                results.append({
-                    "session_id": self._get_entry_field(entry, "session_id", "sid"),
-                    "filename": filename,
-                    "saved_at": self._get_entry_field(entry, "saved_at", "ts"),
-                    "quiz_score": self._get_entry_field(entry, "quiz_score", "qs", 0),
-                    "time_spent": self._get_entry_field(entry, "time_spent", "t", 0),
-                    "summary_preview": self._get_entry_field(entry, "summary_preview", "sp", ""),
-                })
-        return results
+        # Full dates come straight from the per-day lookup; partial ones
+        # (e.g. YYYYMM) still scan every entry
+        if len(date) == 8:
+            entries = self._by_date.get(date, [])
+        else:
+            entries = [
+                entry for entry in self._index["sessions"]
+                if entry.fn.startswith(date)
+            ]
+        return [self._normalize_entry(entry) for entry in entries]
     
     def get_statistics(self) -> dict[str, Any]:
         """Get session statistics."""
-        stats = self._index["statistics"].copy()
+        stats = self._index["statistics"]
         
         # Calculate averages
         total = stats["total_sessions"]
         if total > 0:
-            stats["average_score"] = stats["total_quiz_score"] / total
-            stats["average_time"] = stats["total_time_spent"] / total
+            average_score = stats["total_quiz_score"] / total
+            average_time = stats["total_time_spent"] / total
         else:
-            stats["average_score"] = 0
-            stats["average_time"] = 0
+            average_score = average_time = 0
         
-        return stats
+        # One new dict built with the averages, instead of copy-then-insert
+        return {**stats, "average_score": average_score, "average_time": average_time}
     
     def delete_session(self, session_id: str) -> bool:
         """
@@ -253,29 +553,21 @@ class SessionStorageManager:
         Returns:
             True if deleted, False if not found
         """
-        for i, entry in enumerate(self._index["sessions"]):
-            entry_sid = self._get_entry_field(entry, "session_id", "sid")
-            if entry_sid == session_id:
-                # Remove file
-                filename = self._get_entry_field(entry, "filename", "fn")
-                session_file = self.storage_dir / filename
-                if session_file.exists():
-                    session_file.unlink()
-
-                # Update statistics (support both key formats)
-                stats = self._index["statistics"]
-                stats["total_sessions"] -= 1
-                stats["total_quiz_score"] -= self._get_entry_field(entry, "quiz_score", "qs", 0)
-                stats["total_time_spent"] -= self._get_entry_field(entry, "time_spent", "t", 0)
-
-                # Remove from index
-                self._index["sessions"].pop(i)
-                self._save_index()
-
-                debug_log(f"Session deleted: {session_id}")
-                return True
-
-        return False
+        entry = self._remove_entry(session_id)
+        if entry is None:
+            return False
+
+        # Remove file
+        filename = entry.fn
+        session_file = self.storage_dir / filename
+        if session_file.exists():
+            session_file.unlink()
+        self._session_cache.pop(filename, None)
+
+        self._log_change({"del": session_id})
+
+        debug_log(f"Session deleted: {session_id}")
+        return True
     
     def cleanup_old_sessions(self, max_sessions: int = 100) -> int:
         """
@@ -296,14 +588,16 @@ class SessionStorageManager:
         deleted = 0
 
         for entry in to_delete:
-            filename = self._get_entry_field(entry, "filename", "fn")
+            filename = entry.fn
             session_file = self.storage_dir / filename
             if session_file.exists():
                 session_file.unlink()
+            self._session_cache.pop(filename, None)
             deleted += 1
 
         # Update index
         self._index["sessions"] = sessions[-max_sessions:]
+        self._build_lookup()
         self._save_index()
 
         debug_log(f"Cleaned up {deleted} old sessions")
@@ -320,27 +614,45 @@ class SessionStorageManager:
             Number of sessions exported
         """
         output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Stream the export: the envelope is written around the session files'
+        # own bytes, so only one session is held in memory at a time. Each
+        # file is only validated (to skip unreadable ones), not re-serialized.
+        header = b"".join([
+            b'{\n  "version": 1,\n  "exported_at": ',
+            dump_json_bytes(datetime.now().isoformat()),
+            b',\n  "project_directory": ',
+            dump_json_bytes(self._project_directory_str),
+            b',\n  "statistics": ',
+            dump_json_bytes(self.get_statistics()),
+            b',\n  "sessions": [',
+        ])
+
+        session_files = [
+            self.storage_dir / entry.fn
+            for entry in self._index["sessions"]
+        ]
+        parser = new_json_parser()
+        exported = 0
+        with open(output_path, "wb") as out:
+            out.write(header)
+            for session_file, pending in self._read_concurrently(Path.read_bytes, session_files):
+                try:
+                    raw = pending.result()
+                    if not json_bytes_has_content(raw, parser):
+                        continue
+                except (OSError, ValueError) as e:
+                    debug_log(f"Skipping session file {session_file.name} in export: {e}")
+                    continue
+                out.write(b"\n    " if not exported else b",\n    ")
+                out.write(raw.strip())
+                exported += 1
+            out.write(b"\n  ]\n}\n")
 
-        all_sessions = []
-        for entry in self._index["sessions"]:
-            filename = self._get_entry_field(entry, "filename", "fn")
-            session_file = self.storage_dir / filename
-            data = load_json_file(session_file)
-            if data:
-                all_sessions.append(data)
-
-        export_data = {
-            "version": 1,
-            "exported_at": datetime.now().isoformat(),
-            "project_directory": str(self.project_directory),
-            "statistics": self.get_statistics(),
-            "sessions": all_sessions,
-        }
-
-        save_json_file(output_path, export_data, pretty=True)  # Export uses pretty for readability
-        debug_log(f"Exported {len(all_sessions)} sessions to: {output_path}")
+        debug_log(f"Exported {exported} sessions to: {output_path}")
 
-        return len(all_sessions)
+        return exported
 
     def rebuild_index(self) -> dict[str, int]:
         """
@@ -356,15 +668,22 @@ class SessionStorageManager:
         """
         debug_log("Rebuilding session index from session files...")
 
-        # Find all session files
-        session_files = list(self.storage_dir.glob("*.json"))
-        session_files = [f for f in session_files if f.name != "index.json"]
+        # Find all session files (by name first; Paths only for the matches)
+        with os.scandir(self.storage_dir) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.name.endswith(".json") and entry.name != "index.json"
+            ]
+        session_files = [self.storage_dir / name for name in sorted(names)]
 
         # Reset index
+        now_iso = datetime.now().isoformat()
         new_index = {
-            "version": 1,
-            "created_at": self._index.get("created_at", datetime.now().isoformat()),
-            "rebuilt_at": datetime.now().isoformat(),
+            "version": self.INDEX_VERSION,
+            "created_at": self._index.get("created_at", now_iso),
+            "rebuilt_at": now_iso,
+            # Keep the journal sequence so stale journal lines are not replayed
+            "seq": self._index.get("seq", 0),
             "sessions": [],
             "statistics": {
                 "total_sessions": 0,
@@ -375,9 +694,12 @@ class SessionStorageManager:
 
         stats = {"sessions": 0, "errors": 0}
 
-        for session_file in sorted(session_files):
+        # Files are read on the pool but parsed here with one reusable parser,
+        # which converts only the fields the index needs to Python objects
+        parser = new_json_parser()
+        for session_file, pending in self._read_concurrently(Path.read_bytes, session_files):
             try:
-                data = load_json_file(session_file)
+                data = load_json_fields(pending.result(), self.REBUILD_FIELDS, parser)
                 if not data:
                     stats["errors"] += 1
                     continue
@@ -388,14 +710,14 @@ class SessionStorageManager:
                 time_spent = results.get("time_spent", 0)
 
                 # Add compact index entry
-                new_index["sessions"].append({
-                    "sid": session_id,
-                    "fn": session_file.name,
-                    "ts": data.get("saved_at", ""),
-                    "qs": quiz_score,
-                    "t": time_spent,
-                    "sp": data.get("summary", "")[:50],
-                })
+                new_index["sessions"].append(SessionEntry(
+                    sid=session_id,
+                    fn=session_file.name,
+                    ts=data.get("saved_at", ""),
+                    qs=quiz_score,
+                    t=time_spent,
+                    sp=data.get("summary", "")[:50],
+                ))
 
                 # Update statistics
                 new_index["statistics"]["total_sessions"] += 1
@@ -408,7 +730,9 @@ class SessionStorageManager:
                 stats["errors"] += 1
 
         self._index = new_index
-        self._save_index()
+        self._build_lookup()
+        self._session_cache.clear()  # Files may have changed outside this manager
+        self._save_index(now_iso)
 
         debug_log(f"Session index rebuilt: {stats}")
         return stats
@@ -417,24 +741,23 @@ class SessionStorageManager:
         """
         Recalculate statistics from index entries (Progressive Disclosure).
 
-        Faster than rebuild_index() when index entries are intact.
+        Faster than rebuild_index() when index entries are intact. The
+        totals are kept up to date on every save/delete, so the index is
+        only rewritten when the recount actually differs.
 
         Returns:
             Updated statistics
         """
-        total_score = 0
-        total_time = 0
-
-        for entry in self._index["sessions"]:
-            total_score += self._get_entry_field(entry, "quiz_score", "qs", 0)
-            total_time += self._get_entry_field(entry, "time_spent", "t", 0)
-
-        self._index["statistics"] = {
-            "total_sessions": len(self._index["sessions"]),
-            "total_quiz_score": total_score,
-            "total_time_spent": total_time,
+        sessions = self._index["sessions"]
+        statistics = {
+            "total_sessions": len(sessions),
+            "total_quiz_score": sum(map(attrgetter("qs"), sessions)),
+            "total_time_spent": sum(map(attrgetter("t"), sessions)),
         }
+        if statistics == self._index["statistics"]:
+            return self._index["statistics"]
 
+        self._index["statistics"] = statistics
         self._save_index()
         debug_log(f"Statistics recalculated: {self._index['statistics']}")
         return self._index["statistics"]
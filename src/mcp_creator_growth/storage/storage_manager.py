@@ -6,19 +6,32 @@ High-level storage management that integrates all storage components.
 Provides unified interface for storage operations and cross-component updates.
 """
 
+import os
+import threading
+from collections.abc import Iterable
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from ..debug import server_debug_log as debug_log
 from .debug_index import DebugIndexManager
 from .global_index import GlobalIndexManager
 from .project_meta import ProjectMetaManager
+from .serializers import dump_json_bytes
 from .session_storage import SessionStorageManager
 from .path_resolver import (
     get_global_config_dir,
+    resolve_project_directory,
 )
 
+# Index and journal files (under .mcp-sidecar/) a StorageManager loads from
+_INDEX_FILES = ("debug/index.json", "debug/index.log", "sessions/index.json", "sessions/index.log")
+
+# Cached managers by resolved project path, with the index stamp seen last time
+_managers: dict[str, tuple[tuple[tuple[int, int] | None, ...], "StorageManager"]] = {}
+_managers_lock = threading.Lock()
+
 
 class StorageManager:
     """
@@ -35,7 +48,7 @@ class StorageManager:
         Args:
             project_directory: The project root directory
         """
-        self.project_directory = Path(project_directory).resolve()
+        self.project_directory = resolve_project_directory(project_directory)
         
         # Initialize component managers (lazy)
         self._debug_manager: DebugIndexManager | None = None
@@ -63,7 +76,7 @@ class StorageManager:
     def meta(self) -> ProjectMetaManager:
         """Get the project meta manager (lazy loaded)."""
         if self._meta_manager is None:
-            self._meta_manager = ProjectMetaManager(str(self.project_directory))
+            self._meta_manager = ProjectMetaManager.for_project(str(self.project_directory))
         return self._meta_manager
     
     @property
@@ -256,40 +269,51 @@ class StorageManager:
             },
         }
     
-    def export_all(self, output_path: Path | str) -> dict[str, Any]:
+    def export_all(
+        self,
+        output_path: Path | str,
+        debug_limit: int = 100,
+        session_limit: int = 1000,
+    ) -> dict[str, Any]:
         """
-        Export all project data to a single file.
+        Export project data to a single file.
+        
+        The file is streamed: debug record and session index entries are
+        written one at a time rather than gathered into lists first.
         
         Args:
             output_path: Path to output file (JSON)
+            debug_limit: Maximum debug records to export (the most recent, oldest first)
+            session_limit: Maximum sessions to export (most recent first)
             
         Returns:
             Export summary
         """
-        from .serializers import save_json_file
-        
         output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Gather all data with explicit type annotations
-        debug_records: list[dict[str, Any]] = self.debug.list_records()
-        sessions: list[dict[str, Any]] = self.sessions.list_sessions(limit=1000)
-
-        export_data = {
-            "version": 1,
-            "exported_at": datetime.now().isoformat(),
-            "project_directory": str(self.project_directory),
-            "metadata": self.meta.get_metadata(),
-            "debug_records": debug_records,
-            "sessions": sessions,
-        }
+        header = b"".join([
+            b'{"version":1,"exported_at":',
+            dump_json_bytes(datetime.now().isoformat()),
+            b',"project_directory":',
+            dump_json_bytes(str(self.project_directory)),
+            b',"metadata":',
+            dump_json_bytes(self.meta.get_metadata()),
+            b',"debug_records":[',
+        ])
 
-        save_json_file(output_path, export_data)
+        with open(output_path, "wb") as out:
+            out.write(header)
+            debug_count = _write_json_items(out, self.debug.iter_records(debug_limit))
+            out.write(b'],"sessions":[')
+            session_count = _write_json_items(out, islice(self.sessions.iter_sessions(), session_limit))
+            out.write(b"]}")
 
         return {
             "success": True,
             "path": str(output_path),
-            "debug_count": len(debug_records),
-            "session_count": len(sessions),
+            "debug_count": debug_count,
+            "session_count": session_count,
         }
     
     def cleanup(
@@ -320,19 +344,79 @@ class StorageManager:
         debug_log(f"Storage cleanup complete: {cleaned}")
         
         return cleaned
+    
+    def flush(self, fsync: bool = False) -> None:
+        """
+        Write pending changes of the components in use (e.g. before shutdown).
+        
+        Hot-path writes are replaced atomically but never fsynced; this is
+        the point to make them durable.
+        
+        Args:
+            fsync: If True, also fsync the debug index journal and the session index
+        """
+        if self._debug_manager is not None:
+            self._debug_manager.flush(fsync=fsync)
+        if self._session_manager is not None:
+            self._session_manager.flush(fsync=fsync)
+        if self._meta_manager is not None:
+            self._meta_manager.flush()
+
+
+def _write_json_items(out: IO[bytes], items: Iterable[Any]) -> int:
+    """Write items as comma-separated JSON values (the body of an array); returns the count."""
+    count = 0
+    for item in items:
+        if count:
+            out.write(b",")
+        out.write(dump_json_bytes(item))
+        count += 1
+    return count
+
+
+def _index_stamp(project_path: Path) -> tuple[tuple[int, int] | None, ...]:
+    """Size and mtime of each index file of a project (None if missing)."""
+    stamp = []
+    for name in _INDEX_FILES:
+        try:
+            st = os.stat(project_path / ".mcp-sidecar" / name)
+        except FileNotFoundError:
+            stamp.append(None)
+        else:
+            stamp.append((st.st_size, st.st_mtime_ns))
+    return tuple(stamp)
 
 
 def get_storage_manager(project_directory: str) -> StorageManager:
     """
     Factory function to get a StorageManager instance.
     
+    The manager for a project is reused across calls while its index files
+    are unchanged on disk; once they change (e.g. written by another
+    process or manager) a fresh manager is created that reloads them.
+    Writes through the cached manager itself also count as a change, which
+    costs one reload on the next call.
+    
     Args:
         project_directory: Project directory path
         
     Returns:
         StorageManager instance
     """
-    return StorageManager(project_directory)
+    project_path = resolve_project_directory(project_directory)
+    key = str(project_path)
+    with _managers_lock:
+        cached = _managers.get(key)
+        stamp = _index_stamp(project_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        if cached is not None:
+            # Hand buffered writes over to disk before the new manager loads
+            cached[1].flush()
+            stamp = _index_stamp(project_path)
+        manager = StorageManager(key)
+        _managers[key] = (stamp, manager)
+        return manager
 
 
 def list_all_projects() -> list[dict[str, Any]]:
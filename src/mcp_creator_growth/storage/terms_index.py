@@ -7,12 +7,14 @@ Provides operations for tracking shown terms and retrieving new ones.
 """
 
 import json
+import os
+import threading
 from datetime import datetime
-from pathlib import Path
 from typing import Any
 from collections import OrderedDict
 
 from ..debug import server_debug_log as debug_log
+from .path_resolver import resolve_project_directory
 
 
 # Built-in terms glossary organized by domain
@@ -641,6 +643,31 @@ TERMS_GLOSSARY: dict[str, list[dict[str, str]]] = {
 }
 
 
+def _build_terms_index() -> OrderedDict[str, dict[str, Any]]:
+    """Build a flat index of all terms with unique IDs."""
+    terms = OrderedDict()
+    for domain, domain_terms in TERMS_GLOSSARY.items():
+        for term_data in domain_terms:
+            # Create unique ID from domain + term
+            term_id = f"{domain}:{term_data['term'].lower().replace(' ', '_')}"
+            terms[term_id] = {
+                "id": term_id,
+                "domain": domain,
+                **term_data
+            }
+    return terms
+
+
+# Flat term index, built once and shared by every manager (treat as read-only)
+_ALL_TERMS = _build_terms_index()
+
+# Domain -> that domain's entries of _ALL_TERMS, in index order
+_TERMS_BY_DOMAIN: dict[str, list[dict[str, Any]]] = {
+    domain: [term for term in _ALL_TERMS.values() if term["domain"] == domain]
+    for domain in TERMS_GLOSSARY
+}
+
+
 class TermsIndexManager:
     """
     Manages terms tracking to ensure no term is shown twice.
@@ -657,18 +684,21 @@ class TermsIndexManager:
         Args:
             project_directory: The project root directory
         """
-        self.project_directory = Path(project_directory).resolve()
+        self.project_directory = resolve_project_directory(project_directory)
         self.storage_dir = self.project_directory / ".mcp-sidecar" / "terms"
         self.shown_file = self.storage_dir / "shown.json"
 
         # Ensure storage directory exists
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-        # Load shown terms
+        # Load shown terms (stamped first, so a write racing the load shows as a change)
+        self._shown_stamp = self._shown_file_stamp()
         self._shown = self._load_shown()
+        # Shown term IDs live in a set; the record gets them back as a list on save
+        self._shown_ids: set[str] = set(self._shown.pop("shown_ids", []))
 
-        # Build a flat list of all terms with unique IDs
-        self._all_terms = self._build_terms_index()
+        # Flat index of all terms with unique IDs (shared, built at import)
+        self._all_terms = _ALL_TERMS
 
     def _load_shown(self) -> dict[str, Any]:
         """Load the shown terms record."""
@@ -688,22 +718,18 @@ class TermsIndexManager:
     def _save_shown(self) -> None:
         """Save the shown terms record."""
         self._shown["updated_at"] = datetime.now().isoformat()
+        data = {**self._shown, "shown_ids": sorted(self._shown_ids)}
         with open(self.shown_file, "w", encoding="utf-8") as f:
-            json.dump(self._shown, f, ensure_ascii=False, indent=2)
-
-    def _build_terms_index(self) -> OrderedDict[str, dict[str, Any]]:
-        """Build a flat index of all terms with unique IDs."""
-        terms = OrderedDict()
-        for domain, domain_terms in TERMS_GLOSSARY.items():
-            for term_data in domain_terms:
-                # Create unique ID from domain + term
-                term_id = f"{domain}:{term_data['term'].lower().replace(' ', '_')}"
-                terms[term_id] = {
-                    "id": term_id,
-                    "domain": domain,
-                    **term_data
-                }
-        return terms
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        self._shown_stamp = self._shown_file_stamp()
+
+    def _shown_file_stamp(self) -> tuple[int, int] | None:
+        """Size and mtime of shown.json (None if it does not exist)."""
+        try:
+            st = os.stat(self.shown_file)
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
 
     def get_unshown_terms(self, count: int = 3, domain: str | None = None) -> list[dict[str, Any]]:
         """
@@ -717,13 +743,14 @@ class TermsIndexManager:
             List of term dictionaries
         """
         count = max(1, min(5, count))  # Clamp between 1-5
-        shown_ids = set(self._shown.get("shown_ids", []))
+        shown_ids = self._shown_ids
+
+        # A domain filter only walks that domain's terms
+        candidates = _TERMS_BY_DOMAIN.get(domain, ()) if domain else self._all_terms.values()
 
         result = []
-        for term_id, term_data in self._all_terms.items():
-            if term_id in shown_ids:
-                continue
-            if domain and term_data["domain"] != domain:
+        for term_data in candidates:
+            if term_data["id"] in shown_ids:
                 continue
             result.append(term_data)
             if len(result) >= count:
@@ -738,15 +765,13 @@ class TermsIndexManager:
         Args:
             term_ids: List of term IDs to mark as shown
         """
-        current_shown = set(self._shown.get("shown_ids", []))
-        current_shown.update(term_ids)
-        self._shown["shown_ids"] = list(current_shown)
+        self._shown_ids.update(term_ids)
         self._save_shown()
         debug_log(f"Marked {len(term_ids)} terms as shown")
 
     def get_shown_count(self) -> int:
         """Get the number of terms that have been shown."""
-        return len(self._shown.get("shown_ids", []))
+        return len(self._shown_ids)
 
     def get_total_count(self) -> int:
         """Get the total number of available terms."""
@@ -761,8 +786,8 @@ class TermsIndexManager:
         self._shown = {
             "version": 1,
             "created_at": datetime.now().isoformat(),
-            "shown_ids": [],
         }
+        self._shown_ids = set()
         self._save_shown()
         debug_log("Terms shown history reset")
 
@@ -801,6 +826,26 @@ class TermsIndexManager:
         return results
 
 
+# Cached managers by resolved project path (see _get_manager)
+_managers: dict[str, TermsIndexManager] = {}
+_managers_lock = threading.Lock()
+
+
+def _get_manager(project_directory: str) -> TermsIndexManager:
+    """
+    Get the cached manager for a project.
+
+    The manager is rebuilt when shown.json changed on disk since it last
+    loaded or saved it (e.g. written by another process).
+    """
+    key = str(resolve_project_directory(project_directory))
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None or manager._shown_stamp != manager._shown_file_stamp():
+            manager = _managers[key] = TermsIndexManager(key)
+        return manager
+
+
 def get_session_terms(
     project_directory: str,
     count: int = 3,
@@ -825,7 +870,7 @@ def get_session_terms(
     Returns:
         List of term dictionaries with only the requested language
     """
-    manager = TermsIndexManager(project_directory)
+    manager = _get_manager(project_directory)
     terms = manager.get_unshown_terms(count=count, domain=domain)
 
     if auto_mark and terms:
@@ -0,0 +1,167 @@
+"""
+Tests for the debug index journal, ID allocation and index migration.
+"""
+
+import json
+
+import pytest
+
+from mcp_creator_growth.storage.debug_index import DebugIndexManager
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Keep global storage out of the user's config directory."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / "project"
+    path.mkdir()
+    return str(path)
+
+
+def _record(manager, message, tags=None):
+    return manager.record(
+        context={"error_type": "ImportError", "error_message": message},
+        cause=f"cause of {message}",
+        solution="pip install",
+        tags=tags or ["py"],
+    )
+
+
+class TestRecordIds:
+    def test_two_managers_issue_distinct_ids(self, project):
+        first = DebugIndexManager(project)
+        second = DebugIndexManager(project)
+        _record(first, "warm up")
+        second.get_record_count()  # Load the index before first records again
+
+        first_id = _record(first, "from first")
+        second_id = _record(second, "from second")
+
+        assert first_id != second_id
+        reloaded = DebugIndexManager(project)
+        assert reloaded.get_record(first_id)["cause"] == "cause of from first"
+        assert reloaded.get_record(second_id)["cause"] == "cause of from second"
+        assert reloaded.get_record_count() == 3
+
+    def test_journal_visible_before_close(self, project):
+        first = DebugIndexManager(project)
+        record_id = _record(first, "unclosed")
+
+        second = DebugIndexManager(project)
+        assert second.get_record_count() == 1
+        assert second.search_by_keywords(["unclosed"]) == [record_id]
+
+
+class TestJournal:
+    def test_replay_after_torn_line(self, project):
+        manager = DebugIndexManager(project)
+        first_id = _record(manager, "before tear")
+        manager.close()
+        with open(manager.journal_file, "ab") as f:
+            f.write(b'{"entry": {"id": "torn')  # Interrupted append
+
+        manager = DebugIndexManager(project)
+        second_id = _record(manager, "after tear")
+        manager.close()
+
+        reloaded = DebugIndexManager(project)
+        assert [r["id"] for r in reloaded.list_records()] == [first_id, second_id]
+        assert reloaded.search_by_keywords(["tear"], limit=5) != []
+
+    def test_journal_compaction_round_trip(self, project):
+        manager = DebugIndexManager(project)
+        manager.JOURNAL_COMPACT_BYTES = 512
+        ids = [_record(manager, f"module{i}", tags=["py", f"t{i}"]) for i in range(8)]
+        manager.close()
+
+        # Compaction folded the journal into index.json
+        index = json.loads(manager.index_file.read_text())
+        assert index["columns"]["id"] == ids[:len(index["columns"]["id"])]
+        assert len(index["columns"]["id"]) > 0
+
+        reloaded = DebugIndexManager(project)
+        assert [r["id"] for r in reloaded.list_records()] == ids
+        assert reloaded.search_by_keywords(["module5"]) == [ids[5]]
+        assert [r["id"] for r in reloaded.search_by_tag("t3")] == [ids[3]]
+
+    def test_compact_index_then_rebuild_keywords(self, project):
+        manager = DebugIndexManager(project)
+        ids = [_record(manager, f"module{i}") for i in range(5)]
+
+        stats = manager.compact_index()
+        assert stats["records_kept"] == 5
+        assert DebugIndexManager(project).search_by_keywords(["module2"]) == []
+
+        reloaded = DebugIndexManager(project)
+        assert reloaded.rebuild_keywords() > 0
+        assert reloaded.search_by_keywords(["module2"]) == [ids[2]]
+        assert reloaded._index["keyword_df"]["importerror"] == 5
+
+
+def _write_v3_index(storage_dir, records):
+    """Write record files and a baseline (v3) index.json listing them.
+
+    v3 keeps one dict per record under "records" and posts record-ID
+    strings in its inverted indexes.
+    """
+    tags, error_types = {}, {}
+    for record in records:
+        (storage_dir / f"{record['id']}.json").write_text(json.dumps({
+            "id": record["id"],
+            "timestamp": "2026-01-01T10:00:00",
+            "context": {"error_type": "KeyError", "error_message": record["message"]},
+            "cause": "c",
+            "solution": "s",
+            "tags": ["dict"],
+        }))
+        tags.setdefault("dict", []).append(record["id"])
+        error_types.setdefault("keyerror", []).append(record["id"])
+    (storage_dir / "index.json").write_text(json.dumps({
+        "version": 3,
+        "created_at": "2026-01-01T00:00:00",
+        "records": [record["entry"] for record in records],
+        "tags": {**tags, "stale": ["20251231_abcd_009"]},  # ID with no index record
+        "keywords": {},
+        "error_types": error_types,
+    }))
+
+
+class TestMigration:
+    @pytest.mark.parametrize("long_keys", [False, True])
+    def test_v3_index_migrates_to_columns(self, project, long_keys):
+        storage_dir = DebugIndexManager(project).storage_dir
+        record_ids = ["20260101_abcd_001", "20260101_abcd_002"]
+        records = []
+        for i, record_id in enumerate(record_ids):
+            if long_keys:
+                entry = {"id": record_id, "timestamp": "2026-01-01T10:00:00",
+                         "error_type": "KeyError", "tags": ["dict"]}
+            else:
+                entry = {"id": record_id, "ts": "2026-01-01T10:00:00", "et": "KeyError", "tags": ["dict"]}
+            records.append({"id": record_id, "message": f"missing key{i}", "entry": entry})
+        _write_v3_index(storage_dir, records)
+
+        migrated = DebugIndexManager(project)
+        assert migrated.get_record_count() == 2
+        assert migrated._index["columns"].id == record_ids
+        assert migrated._index["columns"].et == ["KeyError", "KeyError"]
+        assert migrated._index["tags"] == {"dict": [0, 1]}  # Stale posting dropped
+        assert migrated._index["id_counters"] == {"20260101": 2}
+        assert [r["id"] for r in migrated.search_by_tag("dict")] == record_ids
+        assert [r["id"] for r in migrated.search_by_error_type("keyerror")] == record_ids
+        assert migrated.list_records()[0]["timestamp"] == "2026-01-01T10:00:00"
+
+        # v3 indexes carry no keywords; they are rebuilt from the record files
+        migrated.rebuild_keywords()
+        assert migrated.search_by_keywords(["key1"]) == [record_ids[1]]
+
+        new_id = _record(migrated, "after migration")
+        migrated.close()
+        reloaded = DebugIndexManager(project)
+        assert reloaded._index["version"] == DebugIndexManager.INDEX_VERSION
+        assert [r["id"] for r in reloaded.list_records()] == [*record_ids, new_id]
+        assert reloaded.search_by_keywords(["key0"]) == [record_ids[0]]
@@ -0,0 +1,135 @@
+"""
+Tests for the session index journal and in-memory lookups.
+"""
+
+import json
+
+import pytest
+
+from mcp_creator_growth.storage.session_storage import SessionStorageManager
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Keep global storage out of the user's config directory."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / "project"
+    path.mkdir()
+    return str(path)
+
+
+def _save(manager, session_id, summary=None):
+    return manager.save_session(session_id, {"summary": summary or f"summary of {session_id}"},
+                                quiz_score=1, time_spent=2.0)
+
+
+def _session_ids(manager):
+    return [s["session_id"] for s in manager.list_sessions(limit=100)]
+
+
+class TestJournal:
+    def test_changes_are_journaled_and_replayed(self, project):
+        manager = SessionStorageManager(project)
+        _save(manager, "1_a")
+        _save(manager, "1_b")
+        manager.delete_session("1_a")
+
+        assert not manager.index_file.exists()
+        assert len(manager.journal_file.read_bytes().splitlines()) == 3
+
+        reloaded = SessionStorageManager(project)
+        assert _session_ids(reloaded) == ["1_b"]
+        assert reloaded.get_statistics()["total_sessions"] == 1
+        assert reloaded.load_session("1_b")["summary"] == "summary of 1_b"
+
+    def test_replay_skips_lines_already_in_index(self, project):
+        manager = SessionStorageManager(project)
+        _save(manager, "1_a")
+        _save(manager, "1_b")
+        journal = manager.journal_file.read_bytes()
+        manager.flush(fsync=True)
+        assert not manager.journal_file.exists()
+
+        # Crash between writing index.json and removing the journal
+        manager.journal_file.write_bytes(journal)
+        reloaded = SessionStorageManager(project)
+        assert _session_ids(reloaded) == ["1_b", "1_a"]
+        assert reloaded.get_statistics()["total_sessions"] == 2
+
+        # Lines past the saved sequence number are still applied
+        _save(reloaded, "1_c")
+        assert _session_ids(SessionStorageManager(project)) == ["1_c", "1_b", "1_a"]
+
+    def test_append_after_torn_line(self, project):
+        manager = SessionStorageManager(project)
+        _save(manager, "1_a")
+        with open(manager.journal_file, "ab") as f:
+            f.write(b'{"seq": 2, "add": {"sid"')  # Interrupted append
+
+        manager = SessionStorageManager(project)
+        _save(manager, "1_b")
+
+        assert _session_ids(SessionStorageManager(project)) == ["1_b", "1_a"]
+
+    def test_journal_compacts_into_index(self, project):
+        manager = SessionStorageManager(project)
+        manager.JOURNAL_COMPACT_BYTES = 400
+        for i in range(6):
+            _save(manager, f"1_s{i}")
+
+        index = json.loads(manager.index_file.read_text())
+        assert index["seq"] >= 2
+        journal_lines = manager.journal_file.read_bytes().splitlines() if manager.journal_file.exists() else []
+        assert len(index["sessions"]) + len(journal_lines) == 6
+
+        reloaded = SessionStorageManager(project)
+        assert _session_ids(reloaded) == [f"1_s{i}" for i in reversed(range(6))]
+        assert reloaded.get_statistics()["total_sessions"] == 6
+
+    def test_flush_fsync_folds_in_journal(self, project):
+        manager = SessionStorageManager(project)
+        _save(manager, "1_a")
+        manager.flush()  # Nothing unsaved outside the journal
+        assert manager.journal_file.exists()
+
+        manager.flush(fsync=True)
+        assert not manager.journal_file.exists()
+        index = json.loads(manager.index_file.read_text())
+        assert [entry["sid"] for entry in index["sessions"]] == ["1_a"]
+        assert _session_ids(SessionStorageManager(project)) == ["1_a"]
+
+
+class TestDuplicateIds:
+    def test_next_entry_takes_over_on_delete(self, project):
+        manager = SessionStorageManager(project)
+        _save(manager, "1_a", "first")
+        _save(manager, "1_dup", "older")
+        _save(manager, "1_b", "second")
+        _save(manager, "1_dup", "newer")
+        _save(manager, "1_dup", "newest")
+        entries = [e for e in manager._index["sessions"] if e.sid == "1_dup"]
+        assert manager._id_to_entry["1_dup"] is entries[0]
+        assert manager._duplicate_ids == {"1_dup"}
+
+        assert manager.delete_session("1_dup")
+        assert manager._id_to_entry["1_dup"] is entries[1]
+        assert manager._duplicate_ids == {"1_dup"}  # One duplicate is still left
+
+        assert manager.delete_session("1_dup")
+        assert manager._id_to_entry["1_dup"] is entries[2]
+        assert manager._duplicate_ids == set()
+
+        assert manager.delete_session("1_dup")
+        assert "1_dup" not in manager._id_to_entry
+        assert not manager.delete_session("1_dup")
+        assert _session_ids(manager) == ["1_b", "1_a"]
+
+        # Replaying the journal reaches the same state
+        reloaded = SessionStorageManager(project)
+        assert _session_ids(reloaded) == ["1_b", "1_a"]
+        assert reloaded.get_statistics()["total_sessions"] == 2
+        assert reloaded._duplicate_ids == set()
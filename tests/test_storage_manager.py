@@ -0,0 +1,52 @@
+"""
+Tests for the cached StorageManager factory.
+"""
+
+import pytest
+
+from mcp_creator_growth.storage.debug_index import DebugIndexManager
+from mcp_creator_growth.storage.storage_manager import get_storage_manager
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path, monkeypatch):
+    """Keep global storage out of the user's config directory."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / "project"
+    path.mkdir()
+    return str(path)
+
+
+class TestGetStorageManager:
+    def test_reused_while_index_files_unchanged(self, project):
+        manager = get_storage_manager(project)
+        assert get_storage_manager(project) is manager
+        assert get_storage_manager(project + "/.") is manager  # Same resolved path
+
+    def test_replaced_after_outside_write(self, project):
+        manager = get_storage_manager(project)
+        assert manager.debug.get_record_count() == 0
+
+        # Another manager (e.g. another process) records into the project
+        other = DebugIndexManager(project)
+        record_id = other.record(context={"error_type": "KeyError"}, cause="c", solution="s")
+        other.close()
+
+        fresh = get_storage_manager(project)
+        assert fresh is not manager
+        assert fresh.debug.get_record_count() == 1
+        assert fresh.debug.get_record(record_id)["cause"] == "c"
+        assert get_storage_manager(project) is fresh
+
+    def test_own_writes_reload_once(self, project):
+        manager = get_storage_manager(project)
+        manager.sessions.save_session("1_a", {"summary": "s"})
+
+        fresh = get_storage_manager(project)
+        assert fresh is not manager
+        assert [s["session_id"] for s in fresh.sessions.list_sessions()] == ["1_a"]
+        assert get_storage_manager(project) is fresh
@@ -0,0 +1,48 @@
+"""
+Tests for the cached terms index managers.
+"""
+
+import pytest
+
+from mcp_creator_growth.storage.terms_index import TermsIndexManager, _get_manager, get_session_terms
+
+
+@pytest.fixture
+def project(tmp_path):
+    path = tmp_path / "project"
+    path.mkdir()
+    return str(path)
+
+
+def _term_ids(manager, count):
+    return [term["id"] for term in manager.get_unshown_terms(count)]
+
+
+class TestGetManager:
+    def test_reused_across_own_writes(self, project):
+        manager = _get_manager(project)
+        assert _get_manager(project) is manager
+
+        manager.mark_as_shown(_term_ids(manager, 2))
+        assert _get_manager(project) is manager
+        assert _get_manager(project).get_shown_count() == 2
+
+    def test_reloaded_after_outside_write(self, project):
+        manager = _get_manager(project)
+        manager.mark_as_shown(_term_ids(manager, 1))
+
+        # Another process marks more terms as shown
+        other = TermsIndexManager(project)
+        other.mark_as_shown(_term_ids(other, 3))
+
+        fresh = _get_manager(project)
+        assert fresh is not manager
+        assert fresh.get_shown_count() == 4
+        assert _get_manager(project) is fresh
+
+    def test_session_terms_not_repeated(self, project):
+        first = get_session_terms(project, count=3)
+        second = get_session_terms(project, count=3)
+        assert len(first) == len(second) == 3
+        assert not {t["term"] for t in first} & {t["term"] for t in second}
+        assert TermsIndexManager(project).get_shown_count() == 6